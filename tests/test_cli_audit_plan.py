@@ -0,0 +1,45 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from tracker_hacker.cli import _parse_audit_removal_plan
+
+
+def test_repeated_tracker_ids_union_paths_across_chunks(tmp_path):
+    audit_path = tmp_path / "audit_detailed.csv"
+    pd.DataFrame(
+        [
+            {
+                "Tracker Name Id": "a1",
+                "Tracker Name": "First",
+                "Zeta__c (as Site__r.Zeta__c) - Columns": "Fields",
+                "Alpha__c (as Alpha__c) - Columns": None,
+            },
+            {
+                "Tracker Name Id": "b2",
+                "Tracker Name": "Second",
+                "Zeta__c (as Site__r.Zeta__c) - Columns": None,
+                "Alpha__c (as Alpha__c) - Columns": None,
+            },
+            {
+                "Tracker Name Id": "a1",
+                "Tracker Name": "First",
+                "Zeta__c (as Site__r.Zeta__c) - Columns": "Query",
+                "Alpha__c (as Alpha__c) - Columns": "Filters",
+            },
+        ]
+    ).to_csv(audit_path, index=False)
+
+    with pd.read_csv(audit_path, dtype={"Tracker Name Id": str}, chunksize=1) as audit_chunks:
+        removal_plan = _parse_audit_removal_plan(audit_chunks)
+
+    # Later rows add to earlier ones instead of replacing them; rows with no flagged paths are skipped.
+    assert removal_plan == {"a1": ["Alpha__c", "Site__r.Zeta__c"]}
+
+
+def test_audit_without_path_columns_yields_empty_plan(tmp_path):
+    audit_path = tmp_path / "audit_summary.csv"
+    pd.DataFrame([{"Tracker Name Id": "a1", "Tracker Name": "First"}]).to_csv(audit_path, index=False)
+
+    with pd.read_csv(audit_path, dtype={"Tracker Name Id": str}, chunksize=1) as audit_chunks:
+        assert _parse_audit_removal_plan(audit_chunks) == {}
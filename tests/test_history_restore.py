@@ -2,7 +2,13 @@ import pytest
 
 pd = pytest.importorskip("pandas")
 
-from tracker_hacker.history_restore import _parse_timestamp, build_history_state_options
+from tracker_hacker.history_restore import (
+    _parse_timestamp,
+    _parse_timestamp_series,
+    build_history_state_options,
+    get_history_tracker_names,
+    prepare_history,
+)
 
 
 def test_parse_timestamp_uses_day_first_format():
@@ -115,3 +121,58 @@ def test_label_map_only_state_is_hidden():
     options = build_history_state_options(history_df, "Example")
 
     assert options == []
+
+
+def test_rows_without_field_name_are_reported_as_unknown():
+    history_df = pd.DataFrame(
+        [
+            {
+                "Tracker": "Example",
+                "id Tracker": "1",
+                "Modify Date": "04/12/2023 09:00",
+                "Field": None,
+                "Old Value": "old",
+                "New Value": "new",
+            }
+        ]
+    )
+
+    options = build_history_state_options(prepare_history(history_df), "Example")
+
+    assert options[0].fields_changed == ["Unknown field"]
+    assert options[0].changes[0]["field"] == "Unknown field"
+
+
+def test_tracker_names_skip_missing_and_blank_values():
+    history_df = pd.DataFrame({"Tracker": [" Beta ", None, "", "Alpha", "Beta"]})
+
+    assert get_history_tracker_names(history_df) == ["Alpha", "Beta"]
+
+
+def test_modified_by_falls_back_to_last_modified_by_name():
+    history_df = pd.DataFrame(
+        {
+            "Tracker": ["Example", "Example", "Example"],
+            "id Tracker": ["1", "1", "1"],
+            "Modify Date": ["01/12/2023", "01/12/2023", "01/12/2023"],
+            "Field": ["Status", "Query", "Logic"],
+            "Old Value": ["a", "b", "c"],
+            "New Value": ["x", "y", "z"],
+            "Modified By": ["alice", None, ""],
+            "Last Modified By Name": ["bob", "carol", "dave"],
+        }
+    )
+
+    options = build_history_state_options(history_df, "Example")
+
+    assert [change["modified_by"] for change in options[0].changes] == ["alice", "carol", "dave"]
+
+
+def test_timestamp_series_with_inferred_format_matches_scalar_parser():
+    values = ["05/12/2023 11:00", "13/01/2023 09:00", "2023-01-02T10:00:00+02:00", "junk", None]
+
+    parsed = _parse_timestamp_series(pd.Series(values[:2] * 30 + values, dtype=object))
+
+    expected = [_parse_timestamp(value) for value in values]
+    assert parsed.iloc[-5:-2].tolist() == expected[:3]
+    assert parsed.iloc[-2:].isna().all()
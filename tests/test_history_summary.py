@@ -90,6 +90,40 @@ def test_summary_wraps_long_lines():
     assert "\n" in summary
 
 
+def test_oversized_values_skip_character_diff():
+    old_value = "a" * 3000
+    new_value = "b" + "a" * 2998 + "b"
+    changes = [{"field": "Description", "old_value": old_value, "new_value": new_value}]
+
+    summary = _strip_colors(_summarize_history_changes(changes, wrap=False))
+
+    assert summary == "- Description: changed (length 3000 -> 3000; expand to view)"
+
+    expanded = _strip_colors(_summarize_history_changes(changes, wrap=False, expanded=True))
+
+    assert "expand to view" not in expanded
+    assert expanded.startswith("- Description: changed (length 3000 -> 3000): 'aaa")
+    assert "-> 'baaa" in expanded and expanded.endswith("aab'")
+    assert len(expanded) < 400
+
+
+def test_long_values_diff_only_the_changed_middle():
+    old_value = "x" * 3000 + "old" + "y" * 3000
+    new_value = "x" * 3000 + "new" + "y" * 3000
+    changes = [{"field": "Description", "old_value": old_value, "new_value": new_value}]
+
+    summary = _strip_colors(_summarize_history_changes(changes, wrap=False))
+
+    assert summary.startswith("- Description: updated: '…")
+    assert "old" in summary and "new" in summary
+
+
+def test_single_unchanged_value_short_circuits():
+    changes = [{"field": "Status", "old_value": "Open", "new_value": "Open"}]
+
+    assert _summarize_history_changes(changes) == "No change details recorded"
+
+
 def test_long_field_lists_collapse_until_expanded():
     added = ", ".join(f"field_{idx}__c" for idx in range(7))
     changes = [
@@ -0,0 +1,42 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from tracker_hacker.json_checker import check_and_report_malformed_json
+
+
+def test_only_truly_malformed_cells_are_reported(tmp_path):
+    df = pd.DataFrame(
+        {
+            "Tracker Name Id": ["blank", "null", "empty", "parsed", "bad_filters", "bad_formatting", "valid"],
+            "Tracker Name": ["Blank", "Null", "Empty", "Parsed", "Bad Filters", "Bad Formatting", "Valid"],
+            "ObjectName": ["Site__c"] * 7,
+            "Filters": ["", "null", "[]", {"field": "Name"}, '[{"field": ', "[]", '[{"field": "Name"}]'],
+            "Formatting": ["  ", "NaN", None, [{"Name": "red"}], "{}", "{bad", '{"Name": "red"}'],
+        },
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+
+    check_and_report_malformed_json(df, tmp_path)
+
+    (details_path,) = tmp_path.glob("malformed_json_details_*.csv")
+    (rows_path,) = tmp_path.glob("malformed_json_trackers_*.csv")
+    details = pd.read_csv(details_path, encoding="utf-8-sig")
+    rows = pd.read_csv(rows_path, encoding="utf-8-sig")
+
+    assert list(zip(details["Index"], details["Malformed Column"])) == [(14, "Filters"), (15, "Formatting")]
+    assert rows["Tracker Name Id"].tolist() == ["bad_filters", "bad_formatting"]
+
+
+def test_no_report_when_all_cells_are_trivial_or_valid(tmp_path):
+    df = pd.DataFrame(
+        {
+            "Tracker Name Id": ["a1", "a2"],
+            "Filters": ["null", '[{"field": "Name"}]'],
+            "Formatting": ["", "{}"],
+        }
+    )
+
+    check_and_report_malformed_json(df, tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,144 @@
+import threading
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from tracker_hacker.modifications import ALL_ROWS, modify_trackers
+
+
+def _tracker_row(tracker_id, fields="Name", filters="[]", logic="", query=""):
+    return {
+        "Tracker Name Id": tracker_id,
+        "ObjectName": "Site__c",
+        "Tracker Name": f"Tracker {tracker_id}",
+        "Owner ID": "005",
+        "Fields": fields,
+        "Filters": filters,
+        "Logic": logic,
+        "Query": query,
+        "Formatting": "",
+        "OrderBy(Long)": "",
+        "ResizeMap": "",
+        "Label Map": "",
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_report_prompts(monkeypatch):
+    monkeypatch.setenv("TRACKERHACKER_NONINTERACTIVE", "1")
+
+
+class _CancelAfterChecks:
+    """Cancel event that reports set once it has been polled ``checks`` times."""
+
+    def __init__(self, checks):
+        self.checks = checks
+        self.calls = 0
+
+    def is_set(self):
+        self.calls += 1
+        return self.calls > self.checks
+
+
+def test_cancel_before_loop_writes_no_files(tmp_path):
+    df = pd.DataFrame([_tracker_row("a1"), _tracker_row("a2")])
+    cancelled = threading.Event()
+    cancelled.set()
+
+    with pytest.raises(KeyboardInterrupt):
+        modify_trackers(df, ALL_ROWS, [], {}, ["Account.Name"], tmp_path, "ts", cancel_event=cancelled)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cancel_after_row_loop_writes_no_files(tmp_path):
+    df = pd.DataFrame([_tracker_row("a1"), _tracker_row("a2")])
+    # One check per row passes; the check after the loop sees the interrupt.
+    cancel_event = _CancelAfterChecks(checks=len(df))
+
+    with pytest.raises(KeyboardInterrupt):
+        modify_trackers(df, ALL_ROWS, [], {}, ["Account.Name"], tmp_path, "ts", cancel_event=cancel_event)
+
+    assert cancel_event.calls == len(df) + 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def _read_modified(output_dir):
+    return pd.read_csv(output_dir / "modified_ts.csv", encoding="utf-8-sig", dtype=str, keep_default_na=False)
+
+
+def test_chained_swaps_apply_in_pair_order_on_selected_rows(tmp_path):
+    df = pd.DataFrame(
+        [
+            _tracker_row("a0", fields="A__c"),
+            _tracker_row(
+                "a1",
+                fields="Id, A__c",
+                filters='[{"field": "A__c", "label": "A", "sobject": "Site__c"}]',
+                logic="1",
+                query="SELECT Id, A__c FROM Site__c WHERE A__c = 1",
+            ),
+            _tracker_row("a2", fields="A__c, B__c"),
+        ]
+    )
+    df.loc[1, "Formatting"] = "A__c=red"
+
+    modify_trackers(df, [1, 2], [], {"A__c": "B__c", "B__c": "C__c"}, None, tmp_path, "ts")
+
+    modified = _read_modified(tmp_path)
+    assert modified["Tracker Name Id"].tolist() == ["a1", "a2"]
+    first = modified.iloc[0]
+    assert first["Fields"] == "Id, C__c"
+    assert first["Filters"] == '[{"field": "C__c", "label": "C", "sobject": "Site__c"}]'
+    assert first["Query"] == "SELECT Id, C__c FROM Site__c WHERE C__c = 1"
+    assert first["Formatting"] == "C__c=red"
+    # B__c already present: A__c is removed instead of swapped, then B__c is swapped to C__c.
+    assert modified.iloc[1]["Fields"] == "C__c"
+
+
+def test_swap_and_add_on_the_same_row(tmp_path):
+    df = pd.DataFrame([_tracker_row("a1", fields="Id, A__c", query="SELECT Id, A__c FROM Site__c")])
+
+    modify_trackers(df, [0], [], {"A__c": "B__c"}, ["B__c", "Owner.Name"], tmp_path, "ts")
+
+    modified = _read_modified(tmp_path).iloc[0]
+    assert modified["Fields"] == "Id,B__c,Owner.Name"
+    assert modified["Query"] == "SELECT Id, B__c FROM Site__c"
+
+
+def test_swap_where_only_filters_match(tmp_path):
+    df = pd.DataFrame(
+        [_tracker_row("a1", fields="Id", filters='[{"field": "A__c", "label": "A", "sobject": "Site__c"}]')]
+    )
+
+    modify_trackers(df, [0], [], {"A__c": "Site__r.B__c"}, None, tmp_path, "ts")
+
+    modified = _read_modified(tmp_path).iloc[0]
+    assert modified["Fields"] == "Id"
+    filters = modified["Filters"]
+    assert '"field": "Site__r.B__c"' in filters and '"label": "B"' in filters
+
+
+def test_removal_into_empty_float_columns(tmp_path):
+    df = pd.DataFrame([_tracker_row("a1", fields="Id, A__c"), _tracker_row("a2", fields="Id, A__c")])
+    for col in ["Formatting", "OrderBy(Long)", "ResizeMap", "Label Map"]:
+        df[col] = float("nan")
+    assert df["ResizeMap"].dtype == "float64"
+
+    modify_trackers(df, ALL_ROWS, {"a1": ["A__c"]}, {}, None, tmp_path, "ts")
+
+    modified = _read_modified(tmp_path)
+    assert modified["Fields"].tolist() == ["Id", "Id, A__c"]
+    assert modified["ResizeMap"].tolist() == ["", ""]
+
+
+def test_cancel_during_writes_still_writes_both_files(tmp_path):
+    df = pd.DataFrame([_tracker_row("a1"), _tracker_row("a2")])
+    # Rows, then after the loop, swap and add passes, then once before the writes.
+    cancel_event = _CancelAfterChecks(checks=len(df) + 4)
+
+    modify_trackers(df, ALL_ROWS, [], {}, ["Account.Name"], tmp_path, "ts", cancel_event=cancel_event)
+
+    assert cancel_event.calls == len(df) + 4
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["backup_ts.csv", "modified_ts.csv"]
@@ -0,0 +1,69 @@
+import pytest
+
+from tracker_hacker.utils import update_logic, update_query
+
+
+@pytest.mark.parametrize(
+    ("logic", "removed_positions", "expected"),
+    [
+        # Renumbering after removals.
+        ("1 AND 2 AND 3", [2], "1 AND 2"),
+        ("1 AND 2 AND 3 AND 4", [1, 3], "1 AND 2"),
+        ("(1 OR 2) AND 3", [], "(1 OR 2) AND 3"),
+        # Duplicate removals each shift the later positions.
+        ("1 AND 2 AND 3", [2, 2], "1"),
+        ("1 AND 2 AND 3 AND 4", [2, 2], "1 AND 1 AND 2"),
+        # Repeated operators collapse and operators are upper-cased.
+        ("1 AND AND 2", [], "1 AND 2"),
+        ("1 and 2 or 3", [], "1 AND 2 OR 3"),
+        # Operators around a removed position are not merged when they differ.
+        ("1 AND 2 OR 3", [2], "1 AND OR 2"),
+        # Leading and trailing operators are dropped.
+        ("AND 1 OR 2", [], "1 OR 2"),
+        ("1 OR 2 OR", [], "1 OR 2"),
+        ("(1 AND 2) OR 3", [3], "(1 AND 2)"),
+        # No spaces directly inside parentheses.
+        ("( 1 AND 2 )", [], "(1 AND 2)"),
+        # A single remaining position is returned on its own.
+        ("1 AND 2 AND 3", [1, 2], "1"),
+        ("1 AND 1", [], "1"),
+        # Empty results.
+        ("1 AND 2", [1, 2], ""),
+        ("", [1], ""),
+    ],
+)
+def test_update_logic(logic, removed_positions, expected):
+    assert update_logic(logic, removed_positions) == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "paths", "expected"),
+    [
+        (
+            "SELECT Id, Name, A__c FROM X__c WHERE A__c = 1 AND Name != null",
+            ["A__c"],
+            "SELECT Id,Name FROM X__c WHERE (Name != null)",
+        ),
+        (
+            "SELECT Id FROM X WHERE Name = 'a' OR A__c = 1 AND B__c = 2 ORDER BY Name",
+            ["A__c"],
+            "SELECT Id FROM X WHERE (Name = 'a' AND B__c = 2) ORDER BY Name",
+        ),
+        # Nested paths under a removed relationship are dropped from SELECT and WHERE.
+        (
+            "SELECT Id, Site__r.Name, Site__r.Owner.Name FROM X WHERE Site__r.Name = 'a' and B__c = 2",
+            ["Site__r"],
+            "SELECT Id FROM X WHERE (B__c = 2)",
+        ),
+        # Whitespace inside the condition is collapsed.
+        ("SELECT Id FROM X WHERE A__c = 1 AND   B__c   =  2", ["A__c"], "SELECT Id FROM X WHERE (B__c = 2)"),
+        # Already parenthesized conditions are not wrapped again.
+        ("SELECT Id FROM X WHERE (A__c = 1 OR B__c = 2)", ["C__c"], "SELECT Id FROM X WHERE (A__c = 1 OR B__c = 2)"),
+        # An emptied WHERE clause is removed, keeping ORDER BY.
+        ("SELECT Id FROM X WHERE A__c = 1", ["A__c"], "SELECT Id FROM X"),
+        ("SELECT Id FROM X WHERE A__c = 1 ORDER BY Name", ["A__c"], "SELECT Id FROM X ORDER BY Name"),
+        ("SELECT Id FROM X", ["A__c"], "SELECT Id FROM X"),
+    ],
+)
+def test_update_query(query, paths, expected):
+    assert update_query(query, paths) == expected
@@ -2,7 +2,7 @@ import json
 
 import pandas as pd
 
-from tracker_hacker.utils import find_contextual_occurrences_of_field
+from tracker_hacker.utils import find_contextual_occurrences_of_field, load_filters_json
 
 
 # --- START: UNIFIED MASTER AUDIT FUNCTION and WRAPPER ---
@@ -14,7 +14,11 @@ def master_audit(df_to_audit, canonical_fields_to_check, detailed_report=False):
     else:
         found_indices = []
 
-    for idx, row_data in df_to_audit.iterrows():
+    # Plain dicts over only the columns read here avoid building a Series per row.
+    row_columns = list(dict.fromkeys(['Tracker Name Id', 'Tracker Name', 'Owner ID', 'ObjectName'] + cols_to_search))
+    present_columns = [col for col in row_columns if col in df_to_audit.columns]
+    for idx, *row_values in df_to_audit[present_columns].itertuples(name=None):
+        row_data = dict(zip(present_columns, row_values))
         row_had_any_audit_match = False
 
         if detailed_report:
@@ -26,7 +30,7 @@ def master_audit(df_to_audit, canonical_fields_to_check, detailed_report=False):
         filters_json_str = str(row_data.get('Filters', '[]'))
         if filters_json_str.strip():
             try:
-                parsed_filters_for_row = json.loads(filters_json_str)
+                parsed_filters_for_row = load_filters_json(filters_json_str)
             except (json.JSONDecodeError, TypeError):
                 pass
 
@@ -1,11 +1,18 @@
+import os
 import re
 import shutil
+import signal
+import sys
+import threading
 import warnings
 from contextlib import contextmanager
 from datetime import datetime
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from textwrap import indent
+from textwrap import TextWrapper, indent
 
+import numpy as np
 import pandas as pd
 import questionary
 from questionary import Choice
@@ -16,11 +23,34 @@ from tracker_hacker.data_loader import load_source_data_csv
 from tracker_hacker.history_restore import (
     build_history_state_options,
     get_history_tracker_names,
+    load_history_csv,
+    prepare_history,
     restore_tracker_state,
     write_restore_report,
 )
-from tracker_hacker.modifications import identify_modifications, load_swap_pairs_csv, modify_trackers
-from tracker_hacker.utils import handle_cancel
+from tracker_hacker.modifications import (
+    ALL_ROWS,
+    CSV_WRITE_CHUNK_ROWS,
+    identify_modifications,
+    load_swap_pairs_csv,
+    modify_trackers,
+)
+from tracker_hacker.utils import handle_cancel, list_csv_files
+
+
+_LITERAL_RE = re.compile(r"'[^']*'|\"[^\"]*\"")
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_]+(?:__[cr])?(?:\.[A-Za-z0-9_]+(?:__[cr])?)*")
+_SPLIT_RE = re.compile(r"[\s,;|\n]+")
+_SEGMENT_RE = re.compile(r"[A-Za-z0-9_\.]+(?:__[cr])?")
+_AUDIT_COL_RE = re.compile(r".* \(as (.*)\) - Columns$")
+
+
+# Reused wrappers; callers set .width before each use.
+_SUMMARY_WRAPPER = TextWrapper(break_long_words=False, break_on_hyphens=False, subsequent_indent="  ")
+_CHOICE_TITLE_WRAPPER = TextWrapper(break_long_words=False, break_on_hyphens=False)
+
+# SequenceMatcher is quadratic in input size; longer values are summarized by length only.
+MAX_DIFF_INPUT_CHARS = 4000
 
 
 @contextmanager
@@ -31,6 +61,154 @@ def _suppress_restore_warnings():
         yield
 
 
+@contextmanager
+def _deferred_sigint():
+    """Turn Ctrl+C into a flag that long-running work can poll at safe points."""
+    cancelled = threading.Event()
+    try:
+        previous_handler = signal.signal(signal.SIGINT, lambda *_: cancelled.set())
+    except ValueError:
+        # Signal handlers can only be installed from the main thread.
+        yield cancelled
+        return
+    try:
+        yield cancelled
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+
+def _ordered_unique(items) -> list:
+    seen = set()
+    return [item for item in items if not (item in seen or seen.add(item))]
+
+
+def _is_empty(value):
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    try:
+        return pd.isna(value)
+    except Exception:
+        return False
+
+
+def _clean_string(value):
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _extract_field_tokens(value: object) -> tuple[str, ...]:
+    raw = _clean_string(value)
+    if not raw:
+        return ()
+    return _tokenize_field_text(raw)
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_field_text(raw: str) -> tuple[str, ...]:
+    """Ordered, de-duplicated field tokens of a cleaned value; memoized since history rows repeat values."""
+    normalized = raw.replace('[', '').replace(']', '')
+    normalized_no_literals = _LITERAL_RE.sub(" ", normalized)
+    tokens = _TOKEN_RE.findall(normalized_no_literals)
+    unique_tokens: list[str] = []
+    seen_tokens: set[str] = set()
+
+    def _add_unique(token: str) -> None:
+        cleaned = sys.intern(token.strip().strip(',').strip('"\''))
+        if cleaned and cleaned not in seen_tokens:
+            seen_tokens.add(cleaned)
+            unique_tokens.append(cleaned)
+
+    for token in tokens:
+        _add_unique(token)
+
+    if unique_tokens:
+        return tuple(unique_tokens)
+
+    # Fallback: split on common delimiters to capture bracketed or unconventional field names.
+    for segment in _SPLIT_RE.split(normalized):
+        if not segment:
+            continue
+        if _SEGMENT_RE.fullmatch(segment):
+            _add_unique(segment)
+
+    return tuple(unique_tokens)
+
+
+def _diff_field_tokens(old_val: object, new_val: object) -> tuple[list[str], list[str]]:
+    old_tokens = _extract_field_tokens(old_val)
+    new_tokens = _extract_field_tokens(new_val)
+    old_token_set = set(old_tokens)
+    new_token_set = set(new_tokens)
+    added = [tok for tok in new_tokens if tok not in old_token_set]
+    removed = [tok for tok in old_tokens if tok not in new_token_set]
+    return added, removed
+
+
+def _window_excerpt(text, center_start, center_end, context=25, max_len=120):
+    """Return a short excerpt around the changed region."""
+    start = max(center_start - context, 0)
+    end = min(center_end + context, len(text))
+    excerpt = text[start:end]
+    if len(excerpt) > max_len:
+        excerpt = excerpt[: max_len // 2 - 2] + " … " + excerpt[-max_len // 2 + 2 :]
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return f"{prefix}{excerpt}{suffix}" if excerpt else "(empty)"
+
+
+def _describe_change(old_val, new_val, expanded=False):
+    if isinstance(old_val, str) and old_val == new_val:
+        return "no change recorded"
+
+    old_str = _clean_string(old_val)
+    new_str = _clean_string(new_val)
+
+    if _is_empty(old_val) and not _is_empty(new_val):
+        return f"set to '{_window_excerpt(new_str, 0, len(new_str))}'"
+    if not _is_empty(old_val) and _is_empty(new_val):
+        return f"cleared from '{_window_excerpt(old_str, 0, len(old_str))}'"
+
+    if old_str == new_str:
+        return "no change recorded"
+
+    # Only the middle between the common prefix and suffix needs diffing.
+    prefix_len = len(os.path.commonprefix([old_str, new_str]))
+    max_suffix = min(len(old_str), len(new_str)) - prefix_len
+    suffix_len = min(len(os.path.commonprefix([old_str[::-1], new_str[::-1]])), max_suffix)
+    old_core = old_str[prefix_len : len(old_str) - suffix_len]
+    new_core = new_str[prefix_len : len(new_str) - suffix_len]
+
+    if len(old_core) + len(new_core) > MAX_DIFF_INPUT_CHARS:
+        if not expanded:
+            return f"changed (length {len(old_str)} -> {len(new_str)}; expand to view)"
+        # Too large to diff character by character; show bounded excerpts of the differing middle instead.
+        old_excerpt = _window_excerpt(old_str, prefix_len, len(old_str) - suffix_len)
+        new_excerpt = _window_excerpt(new_str, prefix_len, len(new_str) - suffix_len)
+        return f"changed (length {len(old_str)} -> {len(new_str)}): '{old_excerpt}' -> '{new_excerpt}'"
+
+    matcher = SequenceMatcher(None, old_core, new_core, autojunk=True)
+    diff_chunks = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+    if not diff_chunks:
+        return f"changed to '{_window_excerpt(new_str, 0, len(new_str))}'"
+
+    # Focus on the first differing span.
+    tag, i1, i2, j1, j2 = diff_chunks[0]
+    old_excerpt = _window_excerpt(old_str, i1 + prefix_len, i2 + prefix_len)
+    new_excerpt = _window_excerpt(new_str, j1 + prefix_len, j2 + prefix_len)
+    change_label = {"replace": "updated", "delete": "removed", "insert": "added"}.get(tag, "changed")
+    return f"{change_label}: '{old_excerpt}' -> '{new_excerpt}'"
+
+
+def _format_field_tokens(field_name: str, tokens: list[str], action: str, *, expanded: bool, collapse_threshold: int) -> str:
+    if expanded or len(tokens) <= collapse_threshold:
+        return f"{field_name} {action}: {', '.join(tokens)}"
+    plural = "fields" if len(tokens) != 1 else "field"
+    return f"{field_name} {action}: {len(tokens)} {plural} (expand to view)"
+
+
 def _summarize_history_changes(
     changes,
     *,
@@ -40,108 +218,24 @@ def _summarize_history_changes(
     wrap: bool = True,
     bullet_prefix: bool = True,
 ):
-    def _is_empty(value):
-        if value is None:
-            return True
-        if isinstance(value, str):
-            return not value.strip()
-        try:
-            return pd.isna(value)
-        except Exception:
-            return False
-
-    def _clean_string(value):
-        if value is None:
-            return ""
-        return str(value).strip()
-
-    def _extract_field_tokens(value: object) -> list[str]:
-        raw = _clean_string(value)
-        if not raw:
-            return []
-
-        normalized = raw.replace('[', '').replace(']', '')
-        normalized_no_literals = re.sub(r"'[^']*'|\"[^\"]*\"", " ", normalized)
-        tokens = re.findall(
-            r"[A-Za-z0-9_]+(?:__[cr])?(?:\.[A-Za-z0-9_]+(?:__[cr])?)*",
-            normalized_no_literals,
-        )
-        unique_tokens: list[str] = []
-
-        def _add_unique(token: str) -> None:
-            cleaned = token.strip().strip(',').strip('"\'')
-            if cleaned and cleaned not in unique_tokens:
-                unique_tokens.append(cleaned)
-
-        for token in tokens:
-            _add_unique(token)
-
-        if unique_tokens:
-            return unique_tokens
-
-        # Fallback: split on common delimiters to capture bracketed or unconventional field names.
-        for segment in re.split(r"[\s,;|\n]+", normalized):
-            if not segment:
-                continue
-            if re.fullmatch(r"[A-Za-z0-9_\.]+(?:__[cr])?", segment):
-                _add_unique(segment)
-
-        return unique_tokens
-
-    def _diff_field_tokens(old_val: object, new_val: object) -> tuple[list[str], list[str]]:
-        old_tokens = _extract_field_tokens(old_val)
-        new_tokens = _extract_field_tokens(new_val)
-        added = [tok for tok in new_tokens if tok not in old_tokens]
-        removed = [tok for tok in old_tokens if tok not in new_tokens]
-        return added, removed
-
-    def _window_excerpt(text, center_start, center_end, context=25, max_len=120):
-        """Return a short excerpt around the changed region."""
-        start = max(center_start - context, 0)
-        end = min(center_end + context, len(text))
-        excerpt = text[start:end]
-        if len(excerpt) > max_len:
-            excerpt = excerpt[: max_len // 2 - 2] + " … " + excerpt[-max_len // 2 + 2 :]
-        prefix = "…" if start > 0 else ""
-        suffix = "…" if end < len(text) else ""
-        return f"{prefix}{excerpt}{suffix}" if excerpt else "(empty)"
-
-    def _describe_change(old_val, new_val):
-        old_str = _clean_string(old_val)
-        new_str = _clean_string(new_val)
-
-        if _is_empty(old_val) and not _is_empty(new_val):
-            return f"set to '{_window_excerpt(new_str, 0, len(new_str))}'"
-        if not _is_empty(old_val) and _is_empty(new_val):
-            return f"cleared from '{_window_excerpt(old_str, 0, len(old_str))}'"
-
-        if old_str == new_str:
-            return "no change recorded"
-
-        from difflib import SequenceMatcher
-
-        matcher = SequenceMatcher(None, old_str, new_str)
-        diff_chunks = [op for op in matcher.get_opcodes() if op[0] != "equal"]
-        if not diff_chunks:
-            return f"changed to '{_window_excerpt(new_str, 0, len(new_str))}'"
-
-        # Focus on the first differing span.
-        tag, i1, i2, j1, j2 = diff_chunks[0]
-        old_excerpt = _window_excerpt(old_str, i1, i2)
-        new_excerpt = _window_excerpt(new_str, j1, j2)
-        change_label = {"replace": "updated", "delete": "removed", "insert": "added"}.get(tag, "changed")
-        return f"{change_label}: '{old_excerpt}' -> '{new_excerpt}'"
-
     if not changes:
         return "No change details recorded"
+    if len(changes) == 1:
+        only_change = changes[0]
+        old_val = only_change.get("old_value")
+        if isinstance(old_val, str) and old_val == only_change.get("new_value"):
+            return "No change details recorded"
 
     added_fields: list[str] = []
     removed_fields: list[str] = []
     other_changes: list[str] = []
+    other_changes_seen: set[str] = set()
     contextual_field_changes: list[str] = []
+    contextual_field_changes_seen: set[str] = set()
 
-    def _append_unique(collection: list[str], value: str) -> None:
-        if value and value not in collection:
+    def _append_unique(collection: list[str], seen: set[str], value: str) -> None:
+        if value and value not in seen:
+            seen.add(value)
             collection.append(value)
 
     for change in changes:
@@ -153,16 +247,22 @@ def _summarize_history_changes(
         if field_name_lower in {"fields", "query"}:
             added_tokens, removed_tokens = _diff_field_tokens(old_val, new_val)
 
-            def _format_tokens(tokens: list[str], action: str) -> str:
-                if expanded or len(tokens) <= collapse_threshold:
-                    return f"{field_name} {action}: {', '.join(tokens)}"
-                plural = "fields" if len(tokens) != 1 else "field"
-                return f"{field_name} {action}: {len(tokens)} {plural} (expand to view)"
-
             if added_tokens:
-                _append_unique(contextual_field_changes, _format_tokens(added_tokens, "added"))
+                _append_unique(
+                    contextual_field_changes,
+                    contextual_field_changes_seen,
+                    _format_field_tokens(
+                        field_name, added_tokens, "added", expanded=expanded, collapse_threshold=collapse_threshold
+                    ),
+                )
             if removed_tokens:
-                _append_unique(contextual_field_changes, _format_tokens(removed_tokens, "removed"))
+                _append_unique(
+                    contextual_field_changes,
+                    contextual_field_changes_seen,
+                    _format_field_tokens(
+                        field_name, removed_tokens, "removed", expanded=expanded, collapse_threshold=collapse_threshold
+                    ),
+                )
 
             if added_tokens or removed_tokens:
                 continue
@@ -172,26 +272,27 @@ def _summarize_history_changes(
             if expanded:
                 continue
 
-            display_tokens = list(
-                dict.fromkeys(
-                    _extract_field_tokens(old_val) + _extract_field_tokens(new_val)
-                )
+            display_tokens = _ordered_unique(
+                _extract_field_tokens(old_val) + _extract_field_tokens(new_val)
             )
 
             if expanded:
                 if display_tokens:
                     _append_unique(
                         contextual_field_changes,
+                        contextual_field_changes_seen,
                         f"{field_name}: {', '.join(display_tokens)} (values updated)",
                     )
                 else:
                     _append_unique(
                         contextual_field_changes,
+                        contextual_field_changes_seen,
                         f"{field_name}: values updated",
                     )
             else:
                 _append_unique(
                     other_changes,
+                    other_changes_seen,
                     f"{field_name}: values changed (expand to view details)",
                 )
             continue
@@ -203,13 +304,15 @@ def _summarize_history_changes(
             removed_fields.append(field_name)
             continue
 
-        description = _describe_change(old_val, new_val)
-        other_changes.append(f"{field_name}: {description}")
+        description = _describe_change(old_val, new_val, expanded=expanded)
+        other_change = f"{field_name}: {description}"
+        other_changes_seen.add(other_change)
+        other_changes.append(other_change)
 
     summary_lines = []
 
     def _format_field_list(items: list[str], label: str) -> str:
-        unique_items = list(dict.fromkeys(items))
+        unique_items = _ordered_unique(items)
         if expanded or len(unique_items) <= collapse_threshold:
             return f"{label}: {', '.join(unique_items)}"
         plural = "fields" if len(unique_items) != 1 else "field"
@@ -232,51 +335,91 @@ def _summarize_history_changes(
     if not summary_lines:
         return "No change details recorded"
 
-    def _wrap_line(text: str) -> str:
-        if not wrap:
-            return text
-        from textwrap import fill
-
-        terminal_width = wrap_width or shutil.get_terminal_size(fallback=(120, 20)).columns
-        adjusted_width = max(40, terminal_width)
-        return fill(
-            text,
-            width=adjusted_width,
-            break_long_words=False,
-            break_on_hyphens=False,
-            subsequent_indent="  ",
-        )
-
     line_prefix = "- " if bullet_prefix else ""
     separator = "\n\n" if expanded else "\n"
-    formatted_lines = [f"{line_prefix}{_wrap_line(line)}" for line in summary_lines if line]
-    return separator.join(formatted_lines)
+    if not wrap:
+        return separator.join(line_prefix + line for line in summary_lines if line)
+
+    terminal_width = wrap_width or shutil.get_terminal_size(fallback=(120, 20)).columns
+    _SUMMARY_WRAPPER.width = max(40, terminal_width)
+    fill = _SUMMARY_WRAPPER.fill
+    return separator.join(line_prefix + fill(line) for line in summary_lines if line)
+
+
+FILE_TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+RESTORE_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+AUDIT_READ_CHUNK_ROWS = 50_000
+AUDIT_WRITE_BUFFER_BYTES = 1 << 20
+
+
+def _parse_audit_removal_plan(audit_chunks) -> dict[str, list[str]]:
+    """Map each audit 'Tracker Name Id' to the sorted contextual paths flagged in its '(as ...) - Columns' cells.
+
+    ``audit_chunks`` is an iterable of audit DataFrames sharing the same columns (e.g. a chunked read_csv).
+    """
+    # Trackers can appear on several audit rows; union their paths and sort once at the end.
+    removal_plan: dict[str, set[str]] = {}
+    path_cols = None
+    for audit_df in audit_chunks:
+        if path_cols is None:
+            col_to_path = {}
+            for col_header in audit_df.columns:
+                match = _AUDIT_COL_RE.match(str(col_header))
+                if match:
+                    col_to_path[col_header] = match.group(1)
+            if not col_to_path:
+                return {}
+            path_cols = list(col_to_path)
+            paths = [col_to_path[col] for col in path_cols]
+
+        present = audit_df[path_cols].notna().to_numpy()
+        tracker_ids = audit_df['Tracker Name Id'].to_numpy()
+        rows_to_use = audit_df['Tracker Name Id'].notna().to_numpy() & present.any(axis=1)
+        for row_pos in np.flatnonzero(rows_to_use):
+            tracker_paths = removal_plan.setdefault(tracker_ids[row_pos], set())
+            for path, is_present in zip(paths, present[row_pos]):
+                if is_present:
+                    tracker_paths.add(path)
+    return {tracker_id: sorted(tracker_paths) for tracker_id, tracker_paths in removal_plan.items()}
 
 
 CHOICE_POINTER_PADDING = 3
+_CHOICE_SUMMARY_CACHE_MAX = 1024
+# Keyed by (id(changes), wrap_width); the changes list is kept in the value so its id cannot be reused.
+_choice_summary_cache: dict[tuple[int, int], tuple[list, str]] = {}
 
 
-def _format_history_choice_title(option):
-    restore_label = str(option.restore_to)
-    prefix = f"{restore_label} - "
-    pointer_adjusted_width = shutil.get_terminal_size(fallback=(120, 20)).columns - CHOICE_POINTER_PADDING
-    wrap_width = max(40, pointer_adjusted_width)
+def _cached_choice_summary(changes, wrap_width: int) -> str:
+    cache_key = (id(changes), wrap_width)
+    cached = _choice_summary_cache.get(cache_key)
+    if cached is not None and cached[0] is changes:
+        return cached[1]
+
     summary = _summarize_history_changes(
-        option.changes,
+        changes,
         wrap_width=wrap_width,
         wrap=False,
         bullet_prefix=False,
     )
+    if len(_choice_summary_cache) >= _CHOICE_SUMMARY_CACHE_MAX:
+        _choice_summary_cache.clear()
+    _choice_summary_cache[cache_key] = (changes, summary)
+    return summary
 
-    from textwrap import wrap
 
-    available_width = max(10, wrap_width - len(prefix))
-    wrapped_segments = wrap(
-        summary,
-        width=available_width,
-        break_long_words=False,
-        break_on_hyphens=False,
-    )
+def _format_history_choice_title(option, terminal_columns: int | None = None):
+    restore_label = str(option.restore_to)
+    if not option.changes:
+        return restore_label
+    prefix = f"{restore_label} - "
+    if terminal_columns is None:
+        terminal_columns = shutil.get_terminal_size(fallback=(120, 20)).columns
+    pointer_adjusted_width = terminal_columns - CHOICE_POINTER_PADDING
+    wrap_width = max(40, pointer_adjusted_width)
+    summary = _cached_choice_summary(option.changes, wrap_width)
+
+    _CHOICE_TITLE_WRAPPER.width = max(10, wrap_width - len(prefix))
+    wrapped_segments = _CHOICE_TITLE_WRAPPER.wrap(summary)
 
     if not wrapped_segments:
         return prefix.rstrip()
@@ -300,6 +443,8 @@ def _prompt_restore_state_selection(
     confirm_fn = confirm_fn or questionary.confirm
     apply_select_fn = apply_select_fn or questionary.select
     operation_flow_control = None
+    # Choice titles are rendered once by the caller; detailed summaries are kept for reselects.
+    detailed_summaries: dict[int, str] = {}
 
     while operation_flow_control != "return_to_menu":
         try:
@@ -322,10 +467,13 @@ def _prompt_restore_state_selection(
             return handle_cancel("Detailed change prompt interrupted.", return_to_menu=True), None
 
         if show_detail:
-            detailed_summary = _summarize_history_changes(
-                chosen_state_option.changes,
-                expanded=True,
-            )
+            detailed_summary = detailed_summaries.get(id(chosen_state_option))
+            if detailed_summary is None:
+                detailed_summary = _summarize_history_changes(
+                    chosen_state_option.changes,
+                    expanded=True,
+                )
+                detailed_summaries[id(chosen_state_option)] = detailed_summary
             print("\nDetailed change summary:")
             print(detailed_summary)
         elif show_detail is None:
@@ -413,6 +561,9 @@ def main_loop():
             print("No data loaded. Please load source data first.")
             continue
 
+        # One timestamp per action, shared by every file the action writes.
+        action_time = datetime.now()
+        ts_action = action_time.strftime(FILE_TIMESTAMP_FORMAT)
         removal_plan_from_audit = {}
         field_swap_map_cmd = {}
         fields_to_add_list_cmd = []
@@ -429,7 +580,7 @@ def main_loop():
                         audit_path_obj = Path(audit_csv_path_str)
                         selected_audit_file = None
                         if audit_path_obj.is_dir():
-                            audit_files = sorted([f for f in audit_path_obj.glob("*.csv") if f.is_file()])
+                            audit_files = list_csv_files(audit_path_obj)
                             if not audit_files:
                                 print(f"No audit CSVs found in {audit_path_obj}.")
                                 operation_flow_control = "return_to_menu"
@@ -447,23 +598,17 @@ def main_loop():
 
                         if selected_audit_file and operation_flow_control != "return_to_menu":
                             print(f"Parsing audit file: {selected_audit_file.name}...")
-                            audit_df = pd.read_csv(selected_audit_file, dtype={'Tracker Name Id': str})
-                            if 'Tracker Name Id' not in audit_df.columns:
+                            audit_columns = pd.read_csv(selected_audit_file, nrows=0).columns
+                            if 'Tracker Name Id' not in audit_columns:
                                 print("Audit file is missing the required 'Tracker Name Id' column.")
                                 operation_flow_control = "return_to_menu"
                             else:
-                                for _, audit_row in audit_df.iterrows():
-                                    tracker_id = audit_row['Tracker Name Id']
-                                    if pd.isna(tracker_id):
-                                        continue
-                                    fields_to_remove_for_this_tracker = []
-                                    for col_header in audit_df.columns:
-                                        match = re.match(r".* \(as (.*)\) - Columns$", col_header)
-                                        if match and pd.notna(audit_row[col_header]):
-                                            contextual_path = match.group(1)
-                                            fields_to_remove_for_this_tracker.append(contextual_path)
-                                    if fields_to_remove_for_this_tracker:
-                                        removal_plan_from_audit[tracker_id] = sorted(list(set(fields_to_remove_for_this_tracker)))
+                                with pd.read_csv(
+                                    selected_audit_file,
+                                    dtype={'Tracker Name Id': str},
+                                    chunksize=AUDIT_READ_CHUNK_ROWS,
+                                ) as audit_chunks:
+                                    removal_plan_from_audit = _parse_audit_removal_plan(audit_chunks)
                                 if not removal_plan_from_audit:
                                     print("No removal actions could be parsed from the audit file.")
                                     operation_flow_control = "return_to_menu"
@@ -521,7 +666,7 @@ def main_loop():
                                 swap_csv_path_obj = Path(swap_csv_path_str)
                                 selected_swap_csv_file_path = None
                                 if swap_csv_path_obj.is_dir():
-                                    swap_csv_files = sorted([f for f in swap_csv_path_obj.glob("*.csv") if f.is_file()])
+                                    swap_csv_files = list_csv_files(swap_csv_path_obj)
                                     if not swap_csv_files:
                                         print(f"No CSVs in {swap_csv_path_obj}.")
                                         operation_flow_control = "return_to_menu"
@@ -584,7 +729,7 @@ def main_loop():
                         history_path_obj = Path(history_path_str)
                         selected_history_csv = None
                         if history_path_obj.is_dir():
-                            history_csvs = sorted([f for f in history_path_obj.glob("*.csv") if f.is_file()])
+                            history_csvs = list_csv_files(history_path_obj)
                             if not history_csvs:
                                 print(f"No CSV files found in {history_path_obj}.")
                                 operation_flow_control = "return_to_menu"
@@ -608,7 +753,7 @@ def main_loop():
                         if selected_history_csv and operation_flow_control != "return_to_menu":
                             with _suppress_restore_warnings():
                                 try:
-                                    history_df = pd.read_csv(selected_history_csv)
+                                    history_df = load_history_csv(selected_history_csv)
                                 except Exception as exc:
                                     print(f"Failed to load history CSV '{selected_history_csv}': {exc}")
                                     operation_flow_control = "return_to_menu"
@@ -628,6 +773,7 @@ def main_loop():
                                             operation_flow_control = handle_cancel("Tracker selection cancelled.", return_to_menu=True)
                                         else:
                                             try:
+                                                history_df = prepare_history(history_df)
                                                 history_state_options = build_history_state_options(history_df, tracker_name_selected)
                                             except ValueError as exc:
                                                 print(f"Restore failed: {exc}")
@@ -638,8 +784,9 @@ def main_loop():
                                                     operation_flow_control = "return_to_menu"
                                                 else:
                                                     state_choices = []
+                                                    terminal_columns = shutil.get_terminal_size(fallback=(120, 20)).columns
                                                     for opt in history_state_options:
-                                                        formatted_title = _format_history_choice_title(opt)
+                                                        formatted_title = _format_history_choice_title(opt, terminal_columns)
                                                         state_choices.append(
                                                             Choice(title=formatted_title, value=opt)
                                                         )
@@ -660,10 +807,22 @@ def main_loop():
                                                         print(f"Restore failed: {exc}")
                                                         operation_flow_control = "return_to_menu"
                                                     else:
-                                                        selector = state.main_df['Tracker'].astype(str) == restore_result.tracker_name
-                                                        state.main_df.loc[selector, restore_result.restored_row.index] = restore_result.restored_row.values
-
-                                                        ts_restore = datetime.now().strftime("%Y%m%d_%H%M%S")
+                                                        restored_row = restore_result.restored_row
+                                                        if state.tracker_str_values is None:
+                                                            tracker_col = state.main_df['Tracker']
+                                                            if not pd.api.types.is_string_dtype(tracker_col):
+                                                                tracker_col = tracker_col.astype(str)
+                                                            state.tracker_str_values = tracker_col.to_numpy(dtype=object)
+                                                        row_pos = np.flatnonzero(state.tracker_str_values == restore_result.tracker_name)
+                                                        col_pos = state.main_df.columns.get_indexer(restored_row.index)
+                                                        if (col_pos < 0).any():
+                                                            state.main_df.loc[state.main_df.index[row_pos], restored_row.index] = restored_row.values
+                                                        else:
+                                                            state.main_df.iloc[row_pos, col_pos] = restored_row.values
+                                                        if 'Tracker' in restored_row.index:
+                                                            state.tracker_str_values[row_pos] = str(restored_row['Tracker'])
+
+                                                        ts_restore = action_time.strftime(RESTORE_TIMESTAMP_FORMAT)
                                                         report_paths = write_restore_report(
                                                             restore_result,
                                                             output_dir,
@@ -690,13 +849,16 @@ def main_loop():
                             if not audit_data_rows:
                                 print("No trackers found containing any of the specified audit fields.")
                             else:
-                                audit_out_df = pd.DataFrame(audit_data_rows)
                                 fixed_cols = ['Index', 'Tracker Name Id', 'Tracker Name', 'Owner ID', 'ObjectName']
-                                dynamic_cols = sorted([col for col in audit_out_df.columns if col not in fixed_cols])
-                                audit_out_df = audit_out_df[fixed_cols + dynamic_cols]
-                                ts_audit = datetime.now().strftime("%Y%m%d%H%M%S")
-                                audit_f_path = output_dir / f"audit_{ts_audit}.csv"
-                                audit_out_df.to_csv(audit_f_path, index=False, encoding='utf-8-sig')
+                                dynamic_cols = sorted(set().union(*audit_data_rows).difference(fixed_cols))
+                                # Build column-wise in final order: no per-record key scan and no reorder copy.
+                                audit_out_df = pd.DataFrame(
+                                    {col: [row.get(col) for row in audit_data_rows] for col in fixed_cols + dynamic_cols},
+                                    copy=False,
+                                )
+                                audit_f_path = output_dir / f"audit_{ts_action}.csv"
+                                with open(audit_f_path, 'w', encoding='utf-8-sig', newline='', buffering=AUDIT_WRITE_BUFFER_BYTES) as audit_fh:
+                                    audit_out_df.to_csv(audit_fh, index=False, chunksize=CSV_WRITE_CHUNK_ROWS)
                                 print(f"Audit saved to {audit_f_path}")
                                 from tracker_hacker.utils import prompt_to_open_report
                                 prompt_to_open_report(audit_f_path, description="audit report")
@@ -717,22 +879,23 @@ def main_loop():
                 print("No removal plan available.")
                 continue
             tracker_ids_list = list(removal_plan_from_audit.keys())
-            indexed_tracker_ids = {i: tracker_id for i, tracker_id in enumerate(tracker_ids_list)}
             print(f"Trackers identified from audit file: {len(tracker_ids_list)}")
             choices = [
                 Choice(title=f"[{i}] Tracker ID: {t_id}", value=i)
-                for i, t_id in indexed_tracker_ids.items()
+                for i, t_id in enumerate(tracker_ids_list)
             ]
             choices.insert(0, Choice("<Select All>", "__ALL__"))
             try:
                 selected_indices_choices = questionary.checkbox("Select trackers to modify (by audit Tracker Name Id):", choices=choices).ask()
                 if selected_indices_choices is None:
                     operation_flow_control = handle_cancel("Selection cancelled.", return_to_menu=True)
-                elif "__ALL__" in selected_indices_choices:
-                    final_indices_to_process = [idx for idx, row in state.main_df.iterrows() if row['Tracker Name Id'] in tracker_ids_list]
                 else:
-                    selected_tracker_ids = [indexed_tracker_ids[s] for s in selected_indices_choices if isinstance(s, int)]
-                    final_indices_to_process = [idx for idx, row in state.main_df.iterrows() if row['Tracker Name Id'] in selected_tracker_ids]
+                    main_tracker_ids = state.main_df['Tracker Name Id']
+                    if "__ALL__" in selected_indices_choices:
+                        selected_tracker_ids = removal_plan_from_audit.keys()
+                    else:
+                        selected_tracker_ids = {tracker_ids_list[s] for s in selected_indices_choices if isinstance(s, int)}
+                    final_indices_to_process = state.main_df.index[main_tracker_ids.isin(selected_tracker_ids)].tolist()
             except KeyboardInterrupt:
                 operation_flow_control = handle_cancel("Tracker selection interrupted.", return_to_menu=True)
 
@@ -754,9 +917,11 @@ def main_loop():
             try:
                 mods_to_display = identified_modifications_cmd
                 print(f"Trackers identified for modification: {len(mods_to_display)}")
+                mod_indices = list(mods_to_display)
+                tracker_names = state.main_df['Tracker Name'].reindex(mod_indices).tolist()
                 choices = [
-                    Choice(title=f"Index {idx}: {state.main_df.loc[idx, 'Tracker Name']} -> Modifies: {', '.join(cols)}", value=idx)
-                    for idx, cols in mods_to_display.items()
+                    Choice(title=f"Index {idx}: {name} -> Modifies: {', '.join(cols)}", value=idx)
+                    for idx, name, cols in zip(mod_indices, tracker_names, mods_to_display.values())
                 ]
                 choices.insert(0, Choice("<Select All>", "__ALL__"))
 
@@ -764,34 +929,44 @@ def main_loop():
                 if selected is None:
                     operation_flow_control = handle_cancel("Selection cancelled.", return_to_menu=True)
                 elif "__ALL__" in selected:
-                    final_indices_to_process = list(mods_to_display.keys())
+                    if len(mods_to_display) == len(state.main_df):
+                        final_indices_to_process = ALL_ROWS
+                    else:
+                        final_indices_to_process = list(mods_to_display.keys())
                 else:
-                    final_indices_to_process = [s for s in selected if isinstance(s, int)]
+                    # Checkbox values are the identified indices themselves, so no membership check is needed.
+                    final_indices_to_process = np.fromiter((s for s in selected if type(s) is int), dtype=np.int64)
 
             except KeyboardInterrupt:
                 operation_flow_control = handle_cancel("Tracker selection interrupted.", return_to_menu=True)
             if operation_flow_control == "return_to_menu":
                 continue
 
-        if not final_indices_to_process:
+        if final_indices_to_process is not ALL_ROWS and not len(final_indices_to_process):
             print("No trackers ultimately selected for modification.")
             continue
 
-        ts_mod = datetime.now().strftime("%Y%m%d%H%M%S")
+        if final_indices_to_process is not ALL_ROWS:
+            final_indices_to_process = np.asarray(final_indices_to_process, dtype=np.int64)
+
         try:
-            modify_trackers(
-                state.main_df,
-                final_indices_to_process,
-                removal_plan_from_audit if chosen_action == 'remove' else [],
-                field_swap_map_cmd,
-                fields_to_add_list_cmd,
-                output_dir,
-                ts_mod
-            )
+            with _deferred_sigint() as cancelled:
+                modify_trackers(
+                    state.main_df,
+                    final_indices_to_process,
+                    removal_plan_from_audit if chosen_action == 'remove' else [],
+                    field_swap_map_cmd,
+                    fields_to_add_list_cmd,
+                    output_dir,
+                    ts_action,
+                    cancel_event=cancelled,
+                )
         except KeyboardInterrupt:
             handle_cancel("Modification process interrupted by user.", return_to_menu=False)
-            print("Note: If process was interrupted during writing, files might be incomplete.")
+            print("Note: Interrupts are honoured between processing steps; the modified CSV and its backup are only ever written together.")
             break
+        if cancelled.is_set():
+            print("Note: Ctrl+C was pressed while the output files were being written, so it was ignored and the run completed.")
 
         print("-" * 30)
 
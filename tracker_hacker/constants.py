@@ -3,3 +3,4 @@ REQUIRED_COLUMNS = [
     'ObjectName', 'Tracker Name', 'Owner ID', 'Fields', 'Filters', 'Logic', 'Query',
     'Formatting', 'OrderBy(Long)', 'ResizeMap', 'Label Map'
 ]
+REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
@@ -4,10 +4,13 @@ import pandas as pd
 import questionary
 from questionary import Choice
 
-from tracker_hacker.constants import REQUIRED_COLUMNS
+from tracker_hacker.constants import REQUIRED_COLUMNS, REQUIRED_COLUMNS_SET
 from tracker_hacker.json_checker import check_and_report_malformed_json
 from tracker_hacker import state
-from tracker_hacker.utils import handle_cancel
+from tracker_hacker.utils import handle_cancel, list_csv_files
+
+
+AUTOCOMPLETE_CSV_THRESHOLD = 50
 
 
 def load_source_data_csv():
@@ -29,7 +32,7 @@ def load_source_data_csv():
     path_to_load_main_csv = None
 
     if path_obj_input.is_dir():
-        csv_files_in_dir = sorted([f for f in path_obj_input.glob("*.csv") if f.is_file()])
+        csv_files_in_dir = list_csv_files(path_obj_input)
         if not csv_files_in_dir:
             print(f"No CSV files found in directory: {path_obj_input}")
             return False
@@ -37,12 +40,21 @@ def load_source_data_csv():
             path_to_load_main_csv = csv_files_in_dir[0]
             print(f"Automatically selected data CSV: {path_to_load_main_csv.name}")
         else:
-            main_csv_choices = [Choice(title=c.name, value=c) for c in csv_files_in_dir]
-            main_csv_choices.insert(0, Choice(title="<Cancel selection>", value=None))
-
             selected_main_csv_obj = None
             try:
-                selected_main_csv_obj = questionary.select("Select data CSV file:", choices=main_csv_choices).ask()
+                if len(csv_files_in_dir) > AUTOCOMPLETE_CSV_THRESHOLD:
+                    # Type-ahead avoids rendering and repainting a very long select list.
+                    csv_by_name = {c.name: c for c in csv_files_in_dir}
+                    typed_name = questionary.autocomplete(
+                        "Data CSV file name (Tab to complete, empty to cancel):",
+                        choices=list(csv_by_name),
+                        validate=lambda text: not text or text in csv_by_name or "Choose a CSV from this directory.",
+                    ).ask()
+                    selected_main_csv_obj = csv_by_name.get(typed_name) if typed_name else None
+                else:
+                    main_csv_choices = [Choice(title=c.name, value=c) for c in csv_files_in_dir]
+                    main_csv_choices.insert(0, Choice(title="<Cancel selection>", value=None))
+                    selected_main_csv_obj = questionary.select("Select data CSV file:", choices=main_csv_choices).ask()
             except KeyboardInterrupt:
                 return handle_cancel("CSV file selection from directory interrupted.", return_to_menu=True)
 
@@ -67,16 +79,22 @@ def load_source_data_csv():
         return False
 
     try:
-        temp_df = pd.read_csv(path_to_load_main_csv, dtype={'Tracker Name Id': str})
-        missing = [col for col in REQUIRED_COLUMNS if col not in temp_df.columns]
-        if missing:
+        # Validate the header before parsing the whole export.
+        header_columns = pd.read_csv(path_to_load_main_csv, nrows=0).columns
+        if not REQUIRED_COLUMNS_SET.issubset(header_columns):
+            present = set(header_columns)
+            missing = [col for col in REQUIRED_COLUMNS if col not in present]
             print(f"Error: Input CSV '{path_to_load_main_csv.name}' missing required columns: {missing}")
             state.main_df = None
+            state.tracker_str_values = None
             return False
 
+        temp_df = pd.read_csv(path_to_load_main_csv, dtype={'Tracker Name Id': str})
+
         if 'Tracker' not in temp_df.columns and 'Tracker Name' in temp_df.columns:
             temp_df['Tracker'] = temp_df['Tracker Name']
         state.main_df = temp_df
+        state.tracker_str_values = None
         state.main_df._source_file_name = path_to_load_main_csv.name
         print(f"Successfully loaded {len(state.main_df)} trackers from '{path_to_load_main_csv.name}'.")
 
@@ -91,4 +109,5 @@ def load_source_data_csv():
         filename_for_error = path_to_load_main_csv.name if isinstance(path_to_load_main_csv, Path) else str(path_to_load_main_csv)
         print(f"Error loading CSV '{filename_for_error}': {e}")
     state.main_df = None
+    state.tracker_str_values = None
     return False
@@ -1,8 +1,11 @@
+import csv
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -10,6 +13,13 @@ HISTORY_REQUIRED_COLUMNS = [
     'Tracker', 'id Tracker', 'Modify Date', 'Old Value', 'New Value'
 ]
 HISTORY_FIELD_COLUMNS = ['Field', 'API Field']
+HISTORY_USED_COLUMNS = HISTORY_REQUIRED_COLUMNS + HISTORY_FIELD_COLUMNS + [
+    'Tracker Name', 'Tracker Name Id', 'Modified By', 'Last Modified By Name'
+]
+HISTORY_REQUIRED_COLUMNS_SET = frozenset(HISTORY_REQUIRED_COLUMNS)
+HISTORY_USED_COLUMNS_SET = frozenset(HISTORY_USED_COLUMNS)
+HISTORY_COLUMN_ALIASES = {'Tracker': 'Tracker Name', 'id Tracker': 'Tracker Name Id'}
+REPORT_WRITE_BUFFER_BYTES = 1 << 18
 
 
 @dataclass
@@ -25,6 +35,18 @@ class RestoreResult:
     history_rows_used: int = 0
 
 
+@dataclass
+class PreparedHistory:
+    """History frame with the derived per-row columns every restore entry point needs, computed once."""
+    df: pd.DataFrame
+    parsed_dates: pd.Series
+    normalized_tracker: pd.Series
+    tracker_ids: pd.Series
+    field_names: pd.Series
+    ignored_mask: pd.Series
+    modified_by: pd.Series
+
+
 @dataclass
 class HistoryStateOption:
     tracker_name: str
@@ -39,6 +61,24 @@ def _normalize_tracker_name(val: Any) -> str:
     return str(val).strip() if val is not None else ''
 
 
+def _normalize_tracker_names(values: pd.Series) -> pd.Series:
+    # Vectorized _normalize_tracker_name; missing names become '' so they never match a selected tracker.
+    stripped = values.astype('string').str.strip()
+    return pd.Series(stripped.to_numpy(dtype=object, na_value=''), index=values.index, name=values.name)
+
+
+def _categorize_tracker_names(values: pd.Series) -> pd.Series:
+    # _normalize_tracker_names as a categorical: only the distinct raw names are stripped, and
+    # comparisons against a selected tracker become integer code checks.
+    raw_codes, raw_uniques = pd.factorize(values, use_na_sentinel=False)
+    normalized_uniques = _normalize_tracker_names(pd.Series(raw_uniques, dtype=object))
+    unique_codes, categories = pd.factorize(normalized_uniques)
+    return pd.Series(
+        pd.Categorical.from_codes(unique_codes[raw_codes], categories=categories),
+        index=values.index, name=values.name,
+    )
+
+
 def _parse_timestamp(dt_value: Any) -> Optional[pd.Timestamp]:
     if isinstance(dt_value, pd.Timestamp):
         return dt_value
@@ -53,19 +93,85 @@ def _parse_timestamp(dt_value: Any) -> Optional[pd.Timestamp]:
         return None
 
 
-def _get_field_name(row: pd.Series) -> Optional[str]:
-    for col_name in HISTORY_FIELD_COLUMNS:
-        field_val = row.get(col_name)
-        if pd.notna(field_val) and str(field_val).strip():
-            return str(field_val).strip()
+# Day-first layouts seen in history exports, tried before the per-value 'mixed' parser. Only formats
+# that read a value exactly as the day-first 'mixed' parser does belong here.
+MODIFY_DATE_FORMATS = ['%d/%m/%Y %H:%M', '%d/%m/%Y %H:%M:%S', '%d/%m/%Y']
+MODIFY_DATE_FORMAT_SAMPLE_SIZE = 50
+
+
+def _infer_modify_date_format(sample: pd.Series) -> Optional[str]:
+    for date_format in MODIFY_DATE_FORMATS:
+        try:
+            pd.to_datetime(sample, format=date_format, errors='raise')
+        except (ValueError, TypeError):
+            continue
+        return date_format
     return None
 
 
-def _is_ignored_field(field_name: Optional[str]) -> bool:
-    if field_name is None:
-        return False
-    normalized = str(field_name).strip().lower()
-    return normalized in {"resizemap", "resize map", "label map"}
+def _parse_timestamp_series(values: pd.Series) -> pd.Series:
+    # Same per-value rules as _parse_timestamp (day-first, offsets converted to naive UTC, NaT on failure),
+    # in one vectorized call; format='mixed' keeps each value's own format like the scalar parser.
+    # Exports repeat the same batch-edit timestamps, so only the distinct strings are parsed.
+    codes, uniques = pd.factorize(values)
+    unique_values = pd.Series(uniques, dtype=object)
+    date_format = _infer_modify_date_format(unique_values.head(MODIFY_DATE_FORMAT_SAMPLE_SIZE))
+    if date_format is None:
+        parsed_uniques = pd.to_datetime(
+            unique_values, errors='coerce', dayfirst=True, format='mixed', utc=True
+        ).dt.tz_convert(None)
+    else:
+        # Fast fixed-format pass; anything that does not match it goes through the mixed parser.
+        parsed_uniques = pd.to_datetime(unique_values, errors='coerce', format=date_format)
+        unmatched = parsed_uniques.isna().to_numpy()
+        if unmatched.any():
+            parsed_uniques[unmatched] = pd.to_datetime(
+                unique_values[unmatched], errors='coerce', dayfirst=True, format='mixed', utc=True
+            ).dt.tz_convert(None)
+    # Missing values have code -1, which picks the trailing NaT.
+    lookup = np.append(parsed_uniques.to_numpy(), np.datetime64('NaT'))
+    return pd.Series(lookup[codes], index=values.index, name=values.name)
+
+
+def _coalesce_field_names(history_df: pd.DataFrame) -> pd.Series:
+    # First non-blank value of HISTORY_FIELD_COLUMNS per row, stripped; None when every column is blank.
+    field_names = np.full(len(history_df), None, dtype=object)
+    for col_name in reversed(HISTORY_FIELD_COLUMNS):
+        if col_name not in history_df.columns:
+            continue
+        values = history_df[col_name]
+        stripped = values.astype(str).str.strip().to_numpy(dtype=object)
+        usable = values.notna().to_numpy() & (stripped != '')
+        field_names[usable] = stripped[usable]
+    return pd.Series(field_names, index=history_df.index, dtype=object)
+
+
+def _coalesce_modified_by(history_df: pd.DataFrame) -> pd.Series:
+    # 'Modified By' when it holds a value, otherwise 'Last Modified By Name'.
+    modified_by = np.array(_column_values(history_df, 'Last Modified By Name'), dtype=object)
+    if 'Modified By' in history_df.columns:
+        values = history_df['Modified By'].to_numpy(dtype=object)
+        usable = history_df['Modified By'].notna().to_numpy() & (values != '')
+        modified_by[usable] = values[usable]
+    return pd.Series(modified_by, index=history_df.index, dtype=object)
+
+
+IGNORED_FIELD_NAMES = frozenset({"resizemap", "resize map", "label map"})
+
+
+def _ignored_field_mask(field_names: pd.Series) -> pd.Series:
+    # Field names are already stripped (or None); None never matches. Only the distinct names are
+    # lowered and checked, then broadcast back through the factorize codes (-1 picks the trailing False).
+    codes, uniques = pd.factorize(field_names)
+    unique_ignored = pd.Series(uniques, dtype=object).str.lower().isin(IGNORED_FIELD_NAMES).to_numpy(dtype=bool)
+    return pd.Series(np.append(unique_ignored, False)[codes], index=field_names.index)
+
+
+def _column_values(df: pd.DataFrame, col_name: str) -> list:
+    # Column as plain Python values, or all None when absent (matching row.get(col_name)).
+    if col_name in df.columns:
+        return df[col_name].tolist()
+    return [None] * len(df)
 
 
 def _format_value(val: Any) -> str:
@@ -74,49 +180,87 @@ def _format_value(val: Any) -> str:
     return str(val)
 
 
+def _format_values(values: List[Any]) -> List[str]:
+    # _format_value over a whole report column: one vectorized str conversion, with only the
+    # missing cells revisited to tell None/NaN ('(empty)') from other NA scalars.
+    series = pd.Series(values, dtype=object)
+    formatted = series.astype(str).to_numpy(dtype=object)
+    for pos in np.flatnonzero(series.isna().to_numpy()):
+        formatted[pos] = _format_value(values[pos])
+    return formatted.tolist()
+
+
 def _row_delta(before: pd.Series, after: pd.Series) -> List[Dict[str, Any]]:
-    deltas: List[Dict[str, Any]] = []
-    for col in before.index:
-        before_val = before.get(col)
-        after_val = after.get(col)
-        values_equal = (pd.isna(before_val) and pd.isna(after_val)) or (before_val == after_val)
-        if values_equal:
-            continue
-        deltas.append({'column': col, 'before': before_val, 'after': after_val})
-    return deltas
+    before_vals = before.to_numpy(dtype=object)
+    after_vals = after.reindex(before.index).to_numpy(dtype=object)
+    changed = (before_vals != after_vals) & ~(pd.isna(before_vals) & pd.isna(after_vals))
+    return [
+        {'column': before.index[pos], 'before': before_vals[pos], 'after': after_vals[pos]}
+        for pos in np.flatnonzero(changed)
+    ]
+
+
+def load_history_csv(path: Path) -> pd.DataFrame:
+    header = pd.read_csv(path, nrows=0).columns
+    used_columns = [col for col in header if col in HISTORY_USED_COLUMNS_SET]
+    return pd.read_csv(path, dtype=str, usecols=used_columns, engine='c')
 
 
 def validate_history_dataframe(history_df: pd.DataFrame) -> List[str]:
-    missing_columns = [col for col in HISTORY_REQUIRED_COLUMNS if col not in history_df.columns]
+    present_columns = frozenset(history_df.columns)
+    if HISTORY_REQUIRED_COLUMNS_SET.issubset(present_columns):
+        return []
+    missing_columns = [col for col in HISTORY_REQUIRED_COLUMNS if col not in present_columns]
     return missing_columns
 
 
 def get_history_tracker_names(history_df: pd.DataFrame) -> List[str]:
-    history_df = history_df.copy()
-
-    if 'Tracker' not in history_df.columns and 'Tracker Name' in history_df.columns:
-        history_df['Tracker'] = history_df['Tracker Name']
-
-    if 'Tracker' not in history_df.columns:
+    if 'Tracker' in history_df.columns:
+        tracker_values = history_df['Tracker']
+    elif 'Tracker Name' in history_df.columns:
+        tracker_values = history_df['Tracker Name']
+    else:
         return []
 
-    history_df['Tracker'] = history_df['Tracker'].apply(_normalize_tracker_name)
-    tracker_names = [name for name in history_df['Tracker'] if name]
-    return sorted(set(tracker_names))
-
+    # Normalize only the distinct raw values; stripping can merge a few of them again.
+    normalized = _normalize_tracker_names(pd.Series(pd.unique(tracker_values.to_numpy(dtype=object)), dtype=object))
+    return sorted({name for name in normalized if name})
 
-def get_history_changes_for_timestamp(history_df: pd.DataFrame, tracker_name: str, restore_to: Any) -> List[Dict[str, Any]]:
-    history_df = history_df.copy()
 
-    if 'Tracker' not in history_df.columns and 'Tracker Name' in history_df.columns:
-        history_df['Tracker'] = history_df['Tracker Name']
-    if 'id Tracker' not in history_df.columns and 'Tracker Name Id' in history_df.columns:
-        history_df['id Tracker'] = history_df['Tracker Name Id']
+def prepare_history(history_df: Union[pd.DataFrame, PreparedHistory]) -> PreparedHistory:
+    if isinstance(history_df, PreparedHistory):
+        return history_df
 
-    missing_history_cols = validate_history_dataframe(history_df)
+    # The frame is only read; aliased and derived columns are kept alongside it rather than added to a copy.
+    missing_history_cols = [
+        col for col in validate_history_dataframe(history_df)
+        if HISTORY_COLUMN_ALIASES.get(col) not in history_df.columns
+    ]
     if missing_history_cols:
         raise ValueError(f"History dataframe missing required columns: {missing_history_cols}")
 
+    def _aliased(col_name: str) -> pd.Series:
+        if col_name in history_df.columns:
+            return history_df[col_name]
+        return history_df[HISTORY_COLUMN_ALIASES[col_name]]
+
+    field_names = _coalesce_field_names(history_df)
+
+    return PreparedHistory(
+        df=history_df,
+        parsed_dates=_parse_timestamp_series(history_df['Modify Date']),
+        normalized_tracker=_categorize_tracker_names(_aliased('Tracker')),
+        tracker_ids=_aliased('id Tracker'),
+        field_names=field_names,
+        ignored_mask=_ignored_field_mask(field_names),
+        modified_by=_coalesce_modified_by(history_df),
+    )
+
+
+def get_history_changes_for_timestamp(history_df: Union[pd.DataFrame, PreparedHistory], tracker_name: str,
+                                      restore_to: Any) -> List[Dict[str, Any]]:
+    history = prepare_history(history_df)
+
     tracker_name_str = _normalize_tracker_name(tracker_name)
     if not tracker_name_str:
         raise ValueError("A Tracker name must be provided for restore operations.")
@@ -125,88 +269,85 @@ def get_history_changes_for_timestamp(history_df: pd.DataFrame, tracker_name: st
     if parsed_restore_ts is None:
         raise ValueError("Unable to parse restore timestamp. Please provide a valid date/time.")
 
-    history_df['__parsed_modify_date'] = history_df['Modify Date'].apply(_parse_timestamp)
-    history_df['Tracker'] = history_df['Tracker'].apply(_normalize_tracker_name)
-
-    change_rows = history_df[
-        (history_df['Tracker'] == tracker_name_str) &
-        (history_df['__parsed_modify_date'] == parsed_restore_ts)
-    ]
+    change_mask = (
+        (history.normalized_tracker == tracker_name_str) &
+        (history.parsed_dates == parsed_restore_ts) &
+        ~history.ignored_mask
+    )
+    change_rows = history.df[change_mask]
 
     changes: List[Dict[str, Any]] = []
-    for _, row in change_rows.iterrows():
-        field_name = _get_field_name(row) or 'Unknown field'
-        if _is_ignored_field(field_name):
-            continue
-
+    for field_name, old_value, new_value, modified_by, parsed_date, raw_date in zip(
+        history.field_names[change_mask].tolist(),
+        _column_values(change_rows, 'Old Value'),
+        _column_values(change_rows, 'New Value'),
+        history.modified_by[change_mask].tolist(),
+        history.parsed_dates[change_mask].tolist(),
+        _column_values(change_rows, 'Modify Date'),
+    ):
         changes.append({
-            'field': field_name,
-            'old_value': row.get('Old Value'),
-            'new_value': row.get('New Value'),
-            'modified_by': row.get('Modified By') or row.get('Last Modified By Name'),
-            'recorded_at': row.get('__parsed_modify_date') or row.get('Modify Date'),
+            'field': field_name or 'Unknown field',
+            'old_value': old_value,
+            'new_value': new_value,
+            'modified_by': modified_by,
+            'recorded_at': parsed_date or raw_date,
         })
 
     return changes
 
 
-def build_history_state_options(history_df: pd.DataFrame, tracker_name: str) -> List[HistoryStateOption]:
-    history_df = history_df.copy()
-
-    if 'Tracker' not in history_df.columns and 'Tracker Name' in history_df.columns:
-        history_df['Tracker'] = history_df['Tracker Name']
-    if 'id Tracker' not in history_df.columns and 'Tracker Name Id' in history_df.columns:
-        history_df['id Tracker'] = history_df['Tracker Name Id']
-
-    missing_cols = validate_history_dataframe(history_df)
-    if missing_cols:
-        raise ValueError(f"History dataframe missing required columns: {missing_cols}")
+def build_history_state_options(history_df: Union[pd.DataFrame, PreparedHistory], tracker_name: str) -> List[HistoryStateOption]:
+    history = prepare_history(history_df)
 
     tracker_name_str = _normalize_tracker_name(tracker_name)
     if not tracker_name_str:
         raise ValueError("A Tracker name must be provided for restore operations.")
 
-    history_df['Tracker'] = history_df['Tracker'].apply(_normalize_tracker_name)
-    history_df['__parsed_modify_date'] = history_df['Modify Date'].apply(_parse_timestamp)
-
-    tracker_history = history_df[
-        (history_df['Tracker'] == tracker_name_str) &
-        history_df['__parsed_modify_date'].notna()
-    ].copy()
-
-    if tracker_history.empty:
-        return []
-
-    tracker_history['__field_name'] = tracker_history.apply(_get_field_name, axis=1)
-    tracker_history = tracker_history[~tracker_history['__field_name'].apply(_is_ignored_field)].copy()
+    tracker_mask = (
+        (history.normalized_tracker == tracker_name_str) &
+        history.parsed_dates.notna() &
+        ~history.ignored_mask
+    )
+    tracker_history = history.df[tracker_mask]
 
     if tracker_history.empty:
         return []
 
-    grouped = tracker_history.groupby('__parsed_modify_date')
+    # Pull every column once; groups are then just positional index arrays into these lists.
+    tracker_dates = history.parsed_dates[tracker_mask]
+    field_arr = history.field_names[tracker_mask].tolist()
+    date_arr = tracker_dates.tolist()
+    old_arr = _column_values(tracker_history, 'Old Value')
+    new_arr = _column_values(tracker_history, 'New Value')
+    modified_by_arr = history.modified_by[tracker_mask].tolist()
+    raw_date_arr = _column_values(tracker_history, 'Modify Date')
+    id_arr = history.tracker_ids[tracker_mask].tolist()
+    row_labels = tracker_history.index.tolist()
+
+    group_positions = tracker_history.groupby(tracker_dates.to_numpy(), sort=False).indices
     options: List[HistoryStateOption] = []
-    for modify_ts, group in grouped:
-        fields_changed: List[str] = []
+    for modify_ts, positions in group_positions.items():
+        # Insertion-ordered dict as an ordered set of the group's field names.
+        fields_seen: Dict[str, None] = {}
         changes: List[Dict[str, Any]] = []
-        for _, row in group.iterrows():
-            field_name = row.get('__field_name') or _get_field_name(row) or 'Unknown field'
-            if field_name not in fields_changed:
-                fields_changed.append(field_name)
+        for pos in positions:
+            field_name = field_arr[pos] or 'Unknown field'
+            fields_seen[field_name] = None
             changes.append({
                 'field': field_name,
-                'old_value': row.get('Old Value'),
-                'new_value': row.get('New Value'),
-                'modified_by': row.get('Modified By') or row.get('Last Modified By Name'),
-                'recorded_at': row.get('__parsed_modify_date') or row.get('Modify Date'),
+                'old_value': old_arr[pos],
+                'new_value': new_arr[pos],
+                'modified_by': modified_by_arr[pos],
+                'recorded_at': date_arr[pos] or raw_date_arr[pos],
             })
         options.append(
             HistoryStateOption(
                 tracker_name=tracker_name_str,
-                tracker_id=_normalize_tracker_name(group['id Tracker'].iloc[0]),
-                restore_to=modify_ts,
-                fields_changed=fields_changed,
+                tracker_id=_normalize_tracker_name(id_arr[positions[0]]),
+                restore_to=pd.Timestamp(modify_ts),
+                fields_changed=list(fields_seen),
                 changes=changes,
-                history_row_indices=list(group.index),
+                history_row_indices=[row_labels[pos] for pos in positions],
             )
         )
 
@@ -214,7 +355,7 @@ def build_history_state_options(history_df: pd.DataFrame, tracker_name: str) ->
     return options
 
 
-def restore_tracker_state(current_df: pd.DataFrame, history_df: pd.DataFrame, tracker_name: str,
+def restore_tracker_state(current_df: pd.DataFrame, history_df: Union[pd.DataFrame, PreparedHistory], tracker_name: str,
                           restore_to: Any) -> RestoreResult:
     if current_df is None:
         raise ValueError("Current tracker data is not loaded.")
@@ -226,15 +367,7 @@ def restore_tracker_state(current_df: pd.DataFrame, history_df: pd.DataFrame, tr
         else:
             raise ValueError("Current tracker data is missing required 'Tracker' column.")
 
-    history_df = history_df.copy()
-    if 'Tracker' not in history_df.columns and 'Tracker Name' in history_df.columns:
-        history_df['Tracker'] = history_df['Tracker Name']
-    if 'id Tracker' not in history_df.columns and 'Tracker Name Id' in history_df.columns:
-        history_df['id Tracker'] = history_df['Tracker Name Id']
-
-    missing_history_cols = validate_history_dataframe(history_df)
-    if missing_history_cols:
-        raise ValueError(f"History dataframe missing required columns: {missing_history_cols}")
+    history = prepare_history(history_df)
 
     tracker_name_str = _normalize_tracker_name(tracker_name)
     if not tracker_name_str:
@@ -244,58 +377,78 @@ def restore_tracker_state(current_df: pd.DataFrame, history_df: pd.DataFrame, tr
     if parsed_restore_ts is None:
         raise ValueError("Unable to parse restore timestamp. Please provide a valid date/time.")
 
-    tracker_rows = current_df[current_df['Tracker'].astype(str).apply(_normalize_tracker_name) == tracker_name_str]
-    if tracker_rows.empty:
+    tracker_match = (_normalize_tracker_names(current_df['Tracker']) == tracker_name_str).to_numpy()
+    if not tracker_match.any():
         raise ValueError(f"Tracker '{tracker_name_str}' not found in current dataset.")
 
-    base_row = tracker_rows.iloc[0].copy()
+    # Only the first matching row is restored; take it by position instead of filtering the frame.
+    base_row = current_df.iloc[int(tracker_match.argmax())].copy()
     tracker_id_value = _normalize_tracker_name(base_row.get('id Tracker'))
 
-    history_df['__parsed_modify_date'] = history_df['Modify Date'].apply(_parse_timestamp)
-    history_df['Tracker'] = history_df['Tracker'].apply(_normalize_tracker_name)
-    history_df['__field_name'] = history_df.apply(_get_field_name, axis=1)
-    history_df['__is_ignored_field'] = history_df['__field_name'].apply(_is_ignored_field)
-
-    relevant_history = history_df[
-        (history_df['Tracker'] == tracker_name_str) &
-        history_df['__parsed_modify_date'].notna() &
-        (history_df['__parsed_modify_date'] >= parsed_restore_ts) &
-        (~history_df['__is_ignored_field'])
-    ].sort_values('__parsed_modify_date', ascending=False)
+    # One fused boolean pass over the raw arrays instead of chained Series temporaries.
+    parsed_dates = history.parsed_dates.to_numpy()
+    relevant_mask = (history.normalized_tracker == tracker_name_str).to_numpy(copy=True)
+    np.logical_and(relevant_mask, ~np.isnat(parsed_dates), out=relevant_mask)
+    np.logical_and(relevant_mask, parsed_dates >= parsed_restore_ts.to_datetime64(), out=relevant_mask)
+    np.logical_and(relevant_mask, ~history.ignored_mask.to_numpy(), out=relevant_mask)
+    relevant_positions = np.flatnonzero(relevant_mask)
+
+    relevant_history = history.df.iloc[relevant_positions].assign(
+        **{
+            'Tracker': history.normalized_tracker.to_numpy(dtype=object)[relevant_positions],
+            'id Tracker': history.tracker_ids.to_numpy()[relevant_positions],
+        },
+        __parsed_modify_date=parsed_dates[relevant_positions],
+        __field_name=history.field_names.to_numpy()[relevant_positions],
+        __is_ignored_field=False,
+        __modified_by=history.modified_by.to_numpy()[relevant_positions],
+    ).sort_values('__parsed_modify_date', ascending=False)
+    # Carried through the sort only to stay aligned; not part of the reported row data.
+    modified_by_values = relevant_history.pop('__modified_by').tolist()
 
     applied_changes: List[Dict[str, Any]] = []
     skipped_changes: List[Dict[str, Any]] = []
 
-    working_row = base_row.copy()
+    # Replay into a plain object array with field names resolved to positions once.
+    working_vals = base_row.to_numpy(dtype=object, copy=True)
+    column_positions = {name: pos for pos, name in enumerate(base_row.index)}
 
-    for _, hist_row in relevant_history.iterrows():
-        field_name = _get_field_name(hist_row)
-        if not field_name:
+    history_rows = zip(
+        relevant_history['__field_name'].tolist(),
+        _column_values(relevant_history, 'Old Value'),
+        _column_values(relevant_history, 'New Value'),
+        modified_by_values,
+        relevant_history['__parsed_modify_date'].tolist(),
+    )
+    for row_pos, (field_name, old_value, new_value, modified_by, parsed_date) in enumerate(history_rows):
+        if not isinstance(field_name, str) or not field_name:
             skipped_changes.append({
                 'reason': 'Missing field column in history row',
-                'row_data': hist_row.to_dict()
+                'row_data': relevant_history.iloc[row_pos].to_dict()
             })
             continue
-        if field_name not in working_row.index:
+        col_pos = column_positions.get(field_name, -1)
+        if col_pos < 0:
             skipped_changes.append({
                 'reason': f"Field '{field_name}' not present in tracker dataset",
-                'row_data': hist_row.to_dict()
+                'row_data': relevant_history.iloc[row_pos].to_dict()
             })
             continue
 
-        previous_value = working_row[field_name]
-        restored_value = hist_row.get('Old Value')
-        working_row[field_name] = restored_value
+        previous_value = working_vals[col_pos]
+        working_vals[col_pos] = old_value
 
         applied_changes.append({
             'field': field_name,
-            'change_recorded_at': hist_row['__parsed_modify_date'],
-            'modified_by': hist_row.get('Modified By') or hist_row.get('Last Modified By Name'),
+            'change_recorded_at': parsed_date,
+            'modified_by': modified_by,
             'current_value': previous_value,
-            'history_new_value': hist_row.get('New Value'),
-            'restored_value': restored_value,
+            'history_new_value': new_value,
+            'restored_value': old_value,
         })
 
+    restored_dtype = base_row.dtype if pd.api.types.is_string_dtype(base_row.dtype) else object
+    working_row = pd.Series(working_vals, index=base_row.index, name=base_row.name, dtype=restored_dtype)
     delta = _row_delta(base_row, working_row)
 
     return RestoreResult(
@@ -317,59 +470,74 @@ def write_restore_report(result: RestoreResult, output_dir: Path, filename_prefi
     prefix_tracker = result.tracker_name or result.tracker_id
     prefix = filename_prefix or f"restore_{prefix_tracker}_{timestamp_suffix}"
 
-    summary_lines = [
-        f"Tracker: {result.tracker_name}",
-        f"Tracker ID: {result.tracker_id}",
-        f"Restore to: {result.restore_to}",
-        f"History rows applied: {result.history_rows_used}",
-        f"Fields touched: {', '.join(sorted({c['field'] for c in result.applied_changes}) or ['None'])}",
-        "",
-        "Applied changes (most recent first):",
-    ]
-
-    if result.applied_changes:
-        for change in result.applied_changes:
-            summary_lines.append(
-                f"- {change['field']}: {_format_value(change['current_value'])} -> {_format_value(change['restored_value'])}"
-                f" (recorded at {change['change_recorded_at']}, by {change.get('modified_by') or 'unknown'})"
-            )
-    else:
-        summary_lines.append("- None (target time is at or after last change)")
-
-    if result.applied_changes:
-        summary_lines.append("\nDetailed applied change breakdown:")
-        summary_lines.append("Field | Current value | Restored value | History new value | Recorded at/by")
-        summary_lines.append("----- | ------------- | -------------- | ----------------- | --------------")
-        for change in result.applied_changes:
-            summary_lines.append(
-                " | ".join([
-                    change['field'],
-                    _format_value(change['current_value']),
-                    _format_value(change['restored_value']),
-                    _format_value(change.get('history_new_value')),
-                    f"{change['change_recorded_at']} by {change.get('modified_by') or 'unknown'}",
-                ])
-            )
-
-    if result.delta:
-        summary_lines.append("\nBefore vs. restored snapshot:")
-        for diff in result.delta:
-            summary_lines.append(
-                f"* {diff['column']}: '{_format_value(diff['before'])}' -> '{_format_value(diff['after'])}'"
-            )
-    else:
-        summary_lines.append("\nNo differences between current row and restored snapshot.")
+    summary_path = output_dir / f"{prefix}_summary.txt"
+    # Lines are streamed as they are formatted; each one after the header starts with its
+    # separating newline so the file matches a '\n'.join of the lines.
+    with open(summary_path, 'w', buffering=REPORT_WRITE_BUFFER_BYTES) as summary_fh:
+        write = summary_fh.write
+        write(
+            f"Tracker: {result.tracker_name}\n"
+            f"Tracker ID: {result.tracker_id}\n"
+            f"Restore to: {result.restore_to}\n"
+            f"History rows applied: {result.history_rows_used}\n"
+            f"Fields touched: {', '.join(sorted({c['field'] for c in result.applied_changes}) or ['None'])}\n"
+            "\n"
+            "Applied changes (most recent first):"
+        )
 
-    if result.skipped_changes:
-        summary_lines.append("\nSkipped history rows:")
-        for skip in result.skipped_changes:
-            reason = skip.get('reason', 'Unknown reason')
-            summary_lines.append(f"- {reason}")
+        applied = result.applied_changes
+        current_fmt = _format_values([change['current_value'] for change in applied])
+        restored_fmt = _format_values([change['restored_value'] for change in applied])
+        modified_by_fmt = [change.get('modified_by') or 'unknown' for change in applied]
+
+        if applied:
+            for change, current_str, restored_str, modified_by in zip(applied, current_fmt, restored_fmt, modified_by_fmt):
+                write(
+                    f"\n- {change['field']}: {current_str} -> {restored_str}"
+                    f" (recorded at {change['change_recorded_at']}, by {modified_by})"
+                )
+        else:
+            write("\n- None (target time is at or after last change)")
+
+        if applied:
+            write("\n\nDetailed applied change breakdown:")
+            write("\nField | Current value | Restored value | History new value | Recorded at/by")
+            write("\n----- | ------------- | -------------- | ----------------- | --------------")
+            history_new_fmt = _format_values([change.get('history_new_value') for change in applied])
+            for change, current_str, restored_str, history_new_str, modified_by in zip(
+                applied, current_fmt, restored_fmt, history_new_fmt, modified_by_fmt
+            ):
+                write("\n")
+                write(
+                    " | ".join([
+                        change['field'],
+                        current_str,
+                        restored_str,
+                        history_new_str,
+                        f"{change['change_recorded_at']} by {modified_by}",
+                    ])
+                )
+
+        if result.delta:
+            write("\n\nBefore vs. restored snapshot:")
+            before_fmt = _format_values([diff['before'] for diff in result.delta])
+            after_fmt = _format_values([diff['after'] for diff in result.delta])
+            for diff, before_str, after_str in zip(result.delta, before_fmt, after_fmt):
+                write(f"\n* {diff['column']}: '{before_str}' -> '{after_str}'")
+        else:
+            write("\n\nNo differences between current row and restored snapshot.")
 
-    summary_path = output_dir / f"{prefix}_summary.txt"
-    summary_path.write_text('\n'.join(summary_lines))
+        if result.skipped_changes:
+            write("\n\nSkipped history rows:")
+            for skip in result.skipped_changes:
+                reason = skip.get('reason', 'Unknown reason')
+                write(f"\n- {reason}")
 
     restored_row_path = output_dir / f"{prefix}_restored_row.csv"
-    result.restored_row.to_frame().T.to_csv(restored_row_path, index=False)
+    with open(restored_row_path, 'w', encoding='utf-8', newline='', buffering=REPORT_WRITE_BUFFER_BYTES) as row_fh:
+        # One header row and one data row, written directly instead of via a transposed one-row frame.
+        row_writer = csv.writer(row_fh, lineterminator=os.linesep)
+        row_writer.writerow(result.restored_row.index)
+        row_writer.writerow('' if pd.isna(value) else value for value in result.restored_row.to_numpy(dtype=object))
 
     return {'summary': summary_path, 'restored_row': restored_row_path}
@@ -1,76 +1,89 @@
 import json
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
+from tracker_hacker.utils import load_filters_json, load_json
+
+TRIVIAL_JSON_VALUES = frozenset({'', 'null', 'nan', '[]'})
+ERROR_CONTEXT_COLUMNS = ['Tracker Name Id', 'Tracker Name', 'ObjectName']
+
+
+def _error_context_snippet(text, error_pos, context_window=30):
+    # Up to context_window characters either side of the error, with the offending character marked.
+    text_len = len(text)
+    start = max(0, error_pos - context_window)
+    end = min(text_len, error_pos + context_window)
+    if error_pos < text_len:
+        parts = [text[start:error_pos], f" >>>>{text[error_pos]}<<<< ", text[error_pos + 1:end]]
+    elif error_pos == text_len:
+        parts = [text[start:end], " >>>>[END_OF_STRING]<<<< "]
+    else:
+        parts = [text[start:end]]
+    if start > 0:
+        parts.insert(0, "...")
+    if end < text_len:
+        parts.append("...")
+    return ''.join(parts)
+
 
 def check_and_report_malformed_json(df_to_check, output_dir_path):
     json_columns_to_check = ['Filters', 'Formatting']
-    malformed_rows_indices = []
+    # Insertion-ordered set of row labels with at least one malformed column.
+    malformed_row_labels = {}
     error_details_for_file = []
     print("\nChecking for malformed JSON in 'Filters', 'Formatting' columns...")
-    for idx, row_data in df_to_check.iterrows():
-        row_has_at_least_one_malformed_json_column = False
-        for col_name in json_columns_to_check:
-            if col_name not in row_data:
+    json_columns_present = [col for col in json_columns_to_check if col in df_to_check.columns]
+    # Blank, null/nan and empty-list values never need parsing, nor do cells already holding a parsed
+    # dict/list; flag the rest per column up front.
+    needs_parse_by_col = {}
+    for col_name in json_columns_present:
+        values = df_to_check[col_name]
+        stripped = values.astype('string').fillna('').str.strip()
+        needs_parse = (~stripped.str.lower().isin(TRIVIAL_JSON_VALUES)).to_numpy(dtype=bool)
+        if values.dtype == object:
+            needs_parse = needs_parse & ~values.map(type).isin((dict, list)).to_numpy(dtype=bool)
+        needs_parse_by_col[col_name] = needs_parse
+    if json_columns_present:
+        needs_parse_any = np.logical_or.reduce(list(needs_parse_by_col.values()))
+    else:
+        needs_parse_any = np.zeros(len(df_to_check), dtype=bool)
+    candidate_positions = np.flatnonzero(needs_parse_any)
+    row_columns = json_columns_present + [col for col in ERROR_CONTEXT_COLUMNS if col in df_to_check.columns]
+    candidate_rows = df_to_check.iloc[candidate_positions][row_columns]
+    for row_pos, (idx, *row_values) in zip(candidate_positions, candidate_rows.itertuples(name=None)):
+        row_data = dict(zip(row_columns, row_values))
+        for col_name in json_columns_present:
+            if not needs_parse_by_col[col_name][row_pos]:
                 continue
-            json_str_original_val = row_data.get(col_name)
+            json_str_original_val = row_data[col_name]
             if pd.isna(json_str_original_val):
                 json_str_for_parsing = ""
             else:
                 json_str_for_parsing = str(json_str_original_val)
-            json_str_stripped = json_str_for_parsing.strip()
-            if not json_str_stripped:
-                continue
-            if json_str_stripped.lower() == "null":
-                continue
-            if json_str_stripped.lower() == "nan":
-                continue
-            if json_str_stripped == '[]' and col_name in ['Filters', 'Formatting']:
-                continue
             try:
-                if not isinstance(json_str_original_val, (dict, list)):
-                    json.loads(json_str_for_parsing)
+                # Filters go through the shared cache so later audit/modify passes reuse this parse.
+                if col_name == 'Filters':
+                    load_filters_json(json_str_for_parsing)
+                else:
+                    load_json(json_str_for_parsing)
             except json.JSONDecodeError as e:
-                if not row_has_at_least_one_malformed_json_column:
-                    malformed_rows_indices.append(idx)
-                    row_has_at_least_one_malformed_json_column = True
-                context_snippet = ""
-                context_window = 30
-                string_for_context = json_str_for_parsing
-                if hasattr(e, 'pos') and e.pos is not None:
-                    start = max(0, e.pos - context_window)
-                    end = min(len(string_for_context), e.pos + context_window)
-                    char_at_pos = string_for_context[e.pos] if e.pos < len(string_for_context) else "[?]"
-                    if start <= e.pos < len(string_for_context):
-                        context_snippet = (
-                            string_for_context[start:e.pos]
-                            + f" >>>>{char_at_pos}<<<< "
-                            + string_for_context[e.pos + 1:end]
-                        )
-                    elif e.pos == len(string_for_context):
-                        context_snippet = string_for_context[start:end] + " >>>>[END_OF_STRING]<<<< "
-                    else:
-                        context_snippet = string_for_context[start:end]
-                    if start > 0:
-                        context_snippet = "..." + context_snippet
-                    if end < len(string_for_context):
-                        context_snippet = context_snippet + "..."
+                malformed_row_labels[idx] = None
+                context_snippet = _error_context_snippet(json_str_for_parsing, e.pos)
                 error_details_for_file.append({
                     'Index': idx, 'Tracker Name Id': row_data.get('Tracker Name Id', 'N/A'),
                     'Tracker Name': row_data.get('Tracker Name', 'N/A'), 'ObjectName': row_data.get('ObjectName', 'N/A'),
                     'Malformed Column': col_name, 'JSON Error Message': str(e),
                     'Error Context Snippet': context_snippet, 'Problematic Value (Full)': json_str_for_parsing
                 })
-    if malformed_rows_indices:
+    if malformed_row_labels:
         timestamp_str = datetime.now().strftime("%Y%m%d%H%M%S")
         error_filename_full_rows = output_dir_path / f"malformed_json_trackers_{timestamp_str}.csv"
         error_filename_details = output_dir_path / f"malformed_json_details_{timestamp_str}.csv"
-        if malformed_rows_indices:
-            error_df_to_save = df_to_check.loc[list(set(malformed_rows_indices))].copy()
-            error_df_to_save.to_csv(error_filename_full_rows, index=False, encoding='utf-8-sig')
-            print(f"Warning: Found {len(set(malformed_rows_indices))} trackers with malformed JSON in 'Filters' or 'Formatting'.")
-            print(f"         The full data for these trackers has been saved to: {error_filename_full_rows}")
+        df_to_check.loc[list(malformed_row_labels)].to_csv(error_filename_full_rows, index=False, encoding='utf-8-sig')
+        print(f"Warning: Found {len(malformed_row_labels)} trackers with malformed JSON in 'Filters' or 'Formatting'.")
+        print(f"         The full data for these trackers has been saved to: {error_filename_full_rows}")
         if error_details_for_file:
             error_details_df = pd.DataFrame(error_details_for_file)
             detail_cols_order = ['Index', 'Tracker Name Id', 'Tracker Name', 'Owner ID', 'ObjectName',
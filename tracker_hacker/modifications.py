@@ -1,4 +1,5 @@
 import json
+import os
 import re
 
 import pandas as pd
@@ -8,10 +9,11 @@ from tracker_hacker.utils import (
     find_contextual_occurrences_of_field,
     generate_sitetracker_filter_label,
     get_sitetracker_filter_sobject,
-    prompt_to_open_report,
+    load_filters_json,
+    load_json,
+    prompt_to_open_reports,
     remove_field_from_text,
     remove_key_value_entry,
-    swap_field_in_text,
     update_logic,
     update_query,
 )
@@ -50,16 +52,39 @@ def load_swap_pairs_csv(path, old_col_name="OldFieldAPI", new_col_name="NewField
         return None
 
 
+def _word_boundary_pattern(*field_apis):
+    # \b-delimited match of any of the given field API names.
+    return re.compile(rf"\b(?:{'|'.join(re.escape(field_api) for field_api in field_apis)})\b")
+
+
 def identify_modifications(df_to_check, canonical_fields_to_remove=None, swap_map_input=None, canonical_fields_to_add=None):
     mods = {}
-    for idx, row_data in df_to_check.iterrows():
+    row_columns = ['Fields', 'Filters', 'Logic', 'Query', 'Formatting', 'OrderBy(Long)', 'ResizeMap', 'Label Map']
+    present_columns = [col for col in row_columns if col in df_to_check.columns]
+    # Word-boundary patterns for every swap field, compiled once instead of per row and column.
+    new_api_searches = {old_api: _word_boundary_pattern(new_api).search for old_api, new_api in (swap_map_input or {}).items()}
+    # One alternation over every old swap field: a column needs the swap if any of them matches, so each
+    # column is scanned once instead of once per swap pair.
+    any_old_api_search = _word_boundary_pattern(*swap_map_input).search if swap_map_input else None
+    # A parsed filter can only match a removal or swap field whose name appears verbatim in the raw JSON
+    # (unless escapes spell it differently), so rows without any of those names skip json parsing.
+    filter_field_names = [*(canonical_fields_to_remove or []), *(swap_map_input or {}), *(swap_map_input or {}).values()]
+    filter_field_search = (
+        re.compile('|'.join(re.escape(field_name) for field_name in filter_field_names)).search
+        if filter_field_names else None
+    )
+    for idx, *row_values in df_to_check[present_columns].itertuples(name=None):
+        row_data = dict(zip(present_columns, row_values))
         modified_cols = []
         filters_list_parsed_for_row = None
         needs_filters_parsed = (canonical_fields_to_remove or swap_map_input)
         if needs_filters_parsed:
             try:
                 filters_json_str = str(row_data.get('Filters', '[]'))
-                filters_list_parsed_for_row = json.loads(filters_json_str) if filters_json_str.strip() else []
+                if '\\' not in filters_json_str and not filter_field_search(filters_json_str):
+                    filters_list_parsed_for_row = []
+                else:
+                    filters_list_parsed_for_row = load_filters_json(filters_json_str) if filters_json_str.strip() else []
                 if not isinstance(filters_list_parsed_for_row, list):
                     filters_list_parsed_for_row = []
             except (json.JSONDecodeError, TypeError):
@@ -87,7 +112,7 @@ def identify_modifications(df_to_check, canonical_fields_to_remove=None, swap_ma
                         new_field_exists = True
                 if not new_field_exists:
                     fields_str_check = str(row_data.get('Fields', ''))
-                    if re.search(rf"\b{re.escape(new_api_full_path)}\b", fields_str_check):
+                    if new_api_searches[old_api_full_path](fields_str_check):
                         new_field_exists = True
                 field_to_detect = old_api_full_path
                 if filters_list_parsed_for_row is not None:
@@ -95,14 +120,12 @@ def identify_modifications(df_to_check, canonical_fields_to_remove=None, swap_ma
                         modified_cols.append('Filters')
                         if new_field_exists:
                             modified_cols.append('Logic')
-                for col_name in ['Fields', 'Logic', 'Query', 'Formatting', 'OrderBy(Long)', 'ResizeMap', 'Label Map']:
-                    if col_name == 'Filters' and 'Filters' in modified_cols:
-                        continue
-                    if re.search(rf"\b{re.escape(field_to_detect)}\b", str(row_data.get(col_name, ''))):
-                        modified_cols.append(col_name)
+            for col_name in ['Fields', 'Logic', 'Query', 'Formatting', 'OrderBy(Long)', 'ResizeMap', 'Label Map']:
+                if any_old_api_search(str(row_data.get(col_name, ''))):
+                    modified_cols.append(col_name)
         if canonical_fields_to_add:
             current_flds_val = str(row_data.get('Fields', ''))
-            items_in_flds = [i.strip() for i in current_flds_val.split(',') if i.strip()]
+            items_in_flds = {i.strip() for i in current_flds_val.split(',') if i.strip()}
             if any(f_add_canon not in items_in_flds for f_add_canon in canonical_fields_to_add):
                 modified_cols.append('Fields')
         if modified_cols:
@@ -110,21 +133,68 @@ def identify_modifications(df_to_check, canonical_fields_to_remove=None, swap_ma
     return mods
 
 
+CSV_WRITE_CHUNK_ROWS = 100_000
+# Columns modify_trackers reads or rewrites per row; the last two are only read.
+STAGED_COLUMNS = ['Fields', 'Filters', 'Logic', 'Query', 'Formatting', 'OrderBy(Long)', 'ResizeMap', 'Label Map',
+                  'ObjectName', 'Tracker Name Id']
+READ_ONLY_STAGED_COLUMNS = frozenset({'ObjectName', 'Tracker Name Id'})
+SWAP_TEXT_COLUMNS = ['Fields', 'Logic', 'Query', 'Formatting', 'OrderBy(Long)', 'ResizeMap', 'Label Map']
+# Passed as selected_indices to modify_trackers to process every row without building an index list.
+ALL_ROWS = object()
+
+
+def _write_csv(df, path, chunk_rows=CSV_WRITE_CHUNK_ROWS):
+    # Serialize in row chunks so only one chunk's text is held in memory at a time.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, max(len(df), 1), chunk_rows):
+            is_first_chunk = start == 0
+            chunk_text = df.iloc[start:start + chunk_rows].to_csv(index=False, header=is_first_chunk)
+            payload = memoryview(chunk_text.encode('utf-8-sig' if is_first_chunk else 'utf-8'))
+            while payload:
+                written = os.write(fd, payload)
+                payload = payload[written:]
+    finally:
+        os.close(fd)
+
+
+def _raise_if_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise KeyboardInterrupt
+
+
 # --- START: CORRECTED modify_trackers function ---
-def modify_trackers(df_orig, selected_indices, removal_instructions, swap_map_cmd, add_list_cmd, output_dir_path, timestamp_str):
-    backup_df = df_orig.loc[selected_indices].copy()
-    modified_df_copy = df_orig.copy()
+def modify_trackers(df_orig, selected_indices, removal_instructions, swap_map_cmd, add_list_cmd, output_dir_path, timestamp_str,
+                    cancel_event=None):
+    if selected_indices is ALL_ROWS:
+        selected_indices = df_orig.index
+        backup_df = df_orig.copy()
+        modified_df_copy = df_orig.copy()
+    else:
+        # Only the selected rows are modified and written, so only they are copied.
+        backup_df = df_orig.loc[selected_indices].copy()
+        modified_df_copy = backup_df.copy()
     print(f"Processing {len(selected_indices)} selected trackers...")
+    new_api_searches = {new_api: _word_boundary_pattern(new_api).search for new_api in (swap_map_cmd or {}).values()}
+
+    # Rows are edited in plain per-column lists and written back to the frame once after the loop.
+    staged_columns = [col for col in STAGED_COLUMNS if col in modified_df_copy.columns]
+    staged = {col: modified_df_copy[col].tolist() for col in staged_columns}
+    editable_columns = [col for col in staged_columns if col not in READ_ONLY_STAGED_COLUMNS]
+    swap_positions_by_old_api = {old_api: [] for old_api in (swap_map_cmd or {})}
 
-    for idx in selected_indices:
-        base_tracker_sobject_name = str(modified_df_copy.loc[idx, 'ObjectName']) if 'ObjectName' in modified_df_copy.columns else ''
+    for row_pos, idx in enumerate(modified_df_copy.index):
+        _raise_if_cancelled(cancel_event)
+        # Snapshot of this row; edits go to the snapshot and are written back once per row.
+        row = {col: staged[col][row_pos] for col in staged_columns}
+        base_tracker_sobject_name = str(row['ObjectName']) if 'ObjectName' in row else ''
 
         # --- Build effective removal and swap lists for this row ---
         effective_row_remove_list_for_processing = []
 
         # Handle removals coming from an audit file (if removal_instructions is a dict)
         if isinstance(removal_instructions, dict):
-            tracker_id_for_row = modified_df_copy.loc[idx, 'Tracker Name Id']
+            tracker_id_for_row = row['Tracker Name Id']
             effective_row_remove_list_for_processing.extend(removal_instructions.get(tracker_id_for_row, []))
 
         # Handle swap-to-remove logic
@@ -133,16 +203,16 @@ def modify_trackers(df_orig, selected_indices, removal_instructions, swap_map_cm
             for old_api, new_api in swap_map_cmd.items():
                 new_field_exists_in_row = False
                 try:
-                    f_str_check = str(modified_df_copy.loc[idx, 'Filters'] if pd.notna(modified_df_copy.loc[idx, 'Filters']) else '[]')
+                    f_str_check = str(row['Filters'] if pd.notna(row['Filters']) else '[]')
                     if f_str_check.strip():
-                        f_list_check = json.loads(f_str_check)
+                        f_list_check = load_filters_json(f_str_check)
                         if isinstance(f_list_check, list) and any(isinstance(fd, dict) and fd.get('field', '') == new_api for fd in f_list_check):
                             new_field_exists_in_row = True
                 except (json.JSONDecodeError, TypeError):
                     pass
                 if not new_field_exists_in_row:
-                    fields_col_str = str(modified_df_copy.loc[idx, 'Fields'] if pd.notna(modified_df_copy.loc[idx, 'Fields']) else '')
-                    if re.search(rf"\b{re.escape(new_api)}\b", fields_col_str):
+                    fields_col_str = str(row['Fields'] if pd.notna(row['Fields']) else '')
+                    if new_api_searches[new_api](fields_col_str):
                         new_field_exists_in_row = True
 
                 if new_field_exists_in_row:
@@ -158,133 +228,124 @@ def modify_trackers(df_orig, selected_indices, removal_instructions, swap_map_cm
             for rem_full_api in effective_row_remove_list_for_processing:
                 contextual_paths_to_remove.append(rem_full_api)
                 contextual_paths_to_remove.extend(find_contextual_occurrences_of_field(
-                    str(modified_df_copy.loc[idx, 'Fields']), rem_full_api.split('.')[-1]
+                    str(row['Fields']), rem_full_api.split('.')[-1]
                 ))
             contextual_paths_to_remove = sorted(set(contextual_paths_to_remove))
+            # Exact paths as a set and nested paths as one startswith tuple, shared by Filters and Formatting.
+            contextual_path_set = set(contextual_paths_to_remove)
+            contextual_path_prefixes = tuple(rem + '.' for rem in contextual_paths_to_remove)
 
-            modified_df_copy.loc[idx, 'Fields'] = remove_field_from_text(
-                modified_df_copy.loc[idx, 'Fields'] if pd.notna(modified_df_copy.loc[idx, 'Fields']) else '',
+            row['Fields'] = remove_field_from_text(
+                row['Fields'] if pd.notna(row['Fields']) else '',
                 effective_row_remove_list_for_processing[0]
             )
 
             new_filters_list = []
             filters_logic_positions_removed = []
             try:
-                filters_json_str = str(modified_df_copy.loc[idx, 'Filters'] if pd.notna(modified_df_copy.loc[idx, 'Filters']) else '[]')
-                filters_list = json.loads(filters_json_str) if filters_json_str.strip() else []
+                filters_json_str = str(row['Filters'] if pd.notna(row['Filters']) else '[]')
+                filters_list = load_filters_json(filters_json_str) if filters_json_str.strip() else []
                 if isinstance(filters_list, list):
                     for pos, f_cond in enumerate(filters_list, start=1):
                         if isinstance(f_cond, dict):
                             field_val = f_cond.get('field', '')
-                            if field_val in contextual_paths_to_remove or any(field_val.startswith(rem + '.') for rem in contextual_paths_to_remove):
+                            if field_val in contextual_path_set or field_val.startswith(contextual_path_prefixes):
                                 filters_logic_positions_removed.append(pos)
                             else:
                                 new_filters_list.append(f_cond)
-                modified_df_copy.loc[idx, 'Filters'] = json.dumps(new_filters_list)
+                row['Filters'] = json.dumps(new_filters_list)
             except (json.JSONDecodeError, TypeError):
                 pass
 
-            modified_df_copy.loc[idx, 'Logic'] = update_logic(str(modified_df_copy.loc[idx, 'Logic']), filters_logic_positions_removed)
+            row['Logic'] = update_logic(str(row['Logic']), filters_logic_positions_removed)
 
-            modified_df_copy.loc[idx, 'Query'] = update_query(
-                str(modified_df_copy.loc[idx, 'Query']),
+            row['Query'] = update_query(
+                str(row['Query']),
                 contextual_paths_to_remove
             )
 
-            formatting_col_content = str(modified_df_copy.loc[idx, 'Formatting'] if pd.notna(modified_df_copy.loc[idx, 'Formatting']) else '')
+            formatting_col_content = str(row['Formatting'] if pd.notna(row['Formatting']) else '')
             formatting_lines = []
             for line in formatting_col_content.split('\n'):
                 kv_parts = line.split('=')
                 if len(kv_parts) == 2:
                     left_key = kv_parts[0].strip()
                     field_val_left = left_key.split(':')[0].strip()
-                    if field_val_left in contextual_paths_to_remove or any(field_val_left.startswith(rem + '.') for rem in contextual_paths_to_remove):
+                    if field_val_left in contextual_path_set or field_val_left.startswith(contextual_path_prefixes):
                         continue
                 formatting_lines.append(line)
-            modified_df_copy.loc[idx, 'Formatting'] = '\n'.join(formatting_lines)
+            row['Formatting'] = '\n'.join(formatting_lines)
 
-            modified_df_copy.loc[idx, 'OrderBy(Long)'] = remove_key_value_entry(
-                modified_df_copy.loc[idx, 'OrderBy(Long)'] if pd.notna(modified_df_copy.loc[idx, 'OrderBy(Long)']) else '',
+            row['OrderBy(Long)'] = remove_key_value_entry(
+                row['OrderBy(Long)'] if pd.notna(row['OrderBy(Long)']) else '',
                 effective_row_remove_list_for_processing[0]
             )
 
-            resize_map_str = str(modified_df_copy.loc[idx, 'ResizeMap'] if pd.notna(modified_df_copy.loc[idx, 'ResizeMap']) else '')
-            modified_df_copy.loc[idx, 'ResizeMap'] = remove_key_value_entry(resize_map_str, effective_row_remove_list_for_processing[0])
+            resize_map_str = str(row['ResizeMap'] if pd.notna(row['ResizeMap']) else '')
+            row['ResizeMap'] = remove_key_value_entry(resize_map_str, effective_row_remove_list_for_processing[0])
 
-            label_map_str = str(modified_df_copy.loc[idx, 'Label Map'] if pd.notna(modified_df_copy.loc[idx, 'Label Map']) else '')
-            modified_df_copy.loc[idx, 'Label Map'] = remove_key_value_entry(label_map_str, effective_row_remove_list_for_processing[0], separator=':')
+            label_map_str = str(row['Label Map'] if pd.notna(row['Label Map']) else '')
+            row['Label Map'] = remove_key_value_entry(label_map_str, effective_row_remove_list_for_processing[0], separator=':')
 
-        # Swap fields
-        if effective_row_swap_map:
-            for old_api_full, new_api_full in effective_row_swap_map.items():
-                modified_df_copy.loc[idx, 'Fields'] = swap_field_in_text(
-                    modified_df_copy.loc[idx, 'Fields'] if pd.notna(modified_df_copy.loc[idx, 'Fields']) else '',
-                    old_api_full,
-                    new_api_full
-                )
-
-                # Update Filters
-                try:
-                    filters_str_existing = str(modified_df_copy.loc[idx, 'Filters'] if pd.notna(modified_df_copy.loc[idx, 'Filters']) else '[]')
-                    filters_list = json.loads(filters_str_existing) if filters_str_existing.strip() else []
-                    if isinstance(filters_list, list):
-                        for f_dict in filters_list:
-                            if isinstance(f_dict, dict) and f_dict.get('field', '') == old_api_full:
-                                f_dict['field'] = new_api_full
-                                if 'label' in f_dict:
-                                    f_dict['label'] = generate_sitetracker_filter_label(new_api_full)
-                                if 'sobject' in f_dict:
-                                    f_dict['sobject'] = get_sitetracker_filter_sobject(new_api_full, base_tracker_sobject_name)
-                        modified_df_copy.loc[idx, 'Filters'] = json.dumps(filters_list)
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        # Swap fields: Filters is rewritten per row here; the text columns are swapped column-wide below.
+        for old_api_full, new_api_full in effective_row_swap_map.items():
+            swap_positions_by_old_api[old_api_full].append(row_pos)
+            try:
+                filters_str_existing = str(row['Filters'] if pd.notna(row['Filters']) else '[]')
+                filters_list = load_json(filters_str_existing) if filters_str_existing.strip() else []
+                if isinstance(filters_list, list):
+                    for f_dict in filters_list:
+                        if isinstance(f_dict, dict) and f_dict.get('field', '') == old_api_full:
+                            f_dict['field'] = new_api_full
+                            if 'label' in f_dict:
+                                f_dict['label'] = generate_sitetracker_filter_label(new_api_full)
+                            if 'sobject' in f_dict:
+                                f_dict['sobject'] = get_sitetracker_filter_sobject(new_api_full, base_tracker_sobject_name)
+                    row['Filters'] = json.dumps(filters_list)
+            except (json.JSONDecodeError, TypeError):
+                pass
 
-                # Update Logic
-                logic_str_curr = str(modified_df_copy.loc[idx, 'Logic'])
-                modified_df_copy.loc[idx, 'Logic'] = swap_field_in_text(logic_str_curr, old_api_full, new_api_full)
-
-                # Update Query
-                query_str_curr = str(modified_df_copy.loc[idx, 'Query'])
-                modified_df_copy.loc[idx, 'Query'] = swap_field_in_text(query_str_curr, old_api_full, new_api_full)
-
-                # Update Formatting
-                formatting_curr = str(modified_df_copy.loc[idx, 'Formatting'] if pd.notna(modified_df_copy.loc[idx, 'Formatting']) else '')
-                formatting_lines_new = []
-                for line in formatting_curr.split('\n'):
-                    formatting_lines_new.append(swap_field_in_text(line, old_api_full, new_api_full))
-                modified_df_copy.loc[idx, 'Formatting'] = '\n'.join(formatting_lines_new)
-
-                modified_df_copy.loc[idx, 'OrderBy(Long)'] = swap_field_in_text(
-                    modified_df_copy.loc[idx, 'OrderBy(Long)'] if pd.notna(modified_df_copy.loc[idx, 'OrderBy(Long)']) else '',
-                    old_api_full,
-                    new_api_full
-                )
-
-                modified_df_copy.loc[idx, 'ResizeMap'] = swap_field_in_text(
-                    modified_df_copy.loc[idx, 'ResizeMap'] if pd.notna(modified_df_copy.loc[idx, 'ResizeMap']) else '',
-                    old_api_full,
-                    new_api_full
-                )
-
-                modified_df_copy.loc[idx, 'Label Map'] = swap_field_in_text(
-                    modified_df_copy.loc[idx, 'Label Map'] if pd.notna(modified_df_copy.loc[idx, 'Label Map']) else '',
-                    old_api_full,
-                    new_api_full
-                )
-
-        # Add fields
-        if add_list_cmd:
-            cols_to_add_fields_to = ['Fields']
-            for col_add in cols_to_add_fields_to:
-                curr_val_add = str(modified_df_copy.loc[idx, col_add] if pd.notna(modified_df_copy.loc[idx, col_add]) else '')
-                modified_df_copy.loc[idx, col_add] = add_fields_to_list(curr_val_add, add_list_cmd)
+        for col in editable_columns:
+            staged[col][row_pos] = row[col]
+
+    _raise_if_cancelled(cancel_event)
+
+    # Each swap pair is applied as one regex replacement per text column over the rows it applies to.
+    # Pairs run in swap-map order, so every row still sees its swaps in the same sequence.
+    for old_api_full, swap_positions in swap_positions_by_old_api.items():
+        if not swap_positions:
+            continue
+        old_api_pattern = _word_boundary_pattern(old_api_full)
+        for col_name in SWAP_TEXT_COLUMNS:
+            col_values = staged[col_name]
+            if col_name in ('Logic', 'Query'):
+                texts = [str(col_values[pos]) for pos in swap_positions]
+            else:
+                texts = [str(col_values[pos]) if pd.notna(col_values[pos]) else '' for pos in swap_positions]
+            swapped = pd.Series(texts, dtype=object).str.replace(old_api_pattern, swap_map_cmd[old_api_full], regex=True)
+            for pos, value in zip(swap_positions, swapped.tolist()):
+                col_values[pos] = value
+    _raise_if_cancelled(cancel_event)
+
+    # Add fields
+    if add_list_cmd:
+        cols_to_add_fields_to = ['Fields']
+        for col_add in cols_to_add_fields_to:
+            col_values = staged[col_add]
+            for row_pos, curr_val_add in enumerate(col_values):
+                col_values[row_pos] = add_fields_to_list(str(curr_val_add if pd.notna(curr_val_add) else ''), add_list_cmd)
+    _raise_if_cancelled(cancel_event)
+
+    for col in editable_columns:
+        modified_df_copy[col] = staged[col]
 
     output_f = output_dir_path / f"modified_{timestamp_str}.csv"
     backup_f = output_dir_path / f"backup_{timestamp_str}.csv"
-    modified_df_copy.loc[selected_indices].to_csv(output_f, index=False, encoding='utf-8-sig')
-    backup_df.to_csv(backup_f, index=False, encoding='utf-8-sig')
+    # The modified CSV and its backup are written as one step so neither exists without the other.
+    _raise_if_cancelled(cancel_event)
+    _write_csv(modified_df_copy, output_f)
+    _write_csv(backup_df, backup_f)
     print(f"Modified data for {len(selected_indices)} trackers saved to {output_f}")
     print(f"Backup of original selected trackers saved to {backup_f}")
-    prompt_to_open_report(output_f, description="modified tracker report")
-    prompt_to_open_report(backup_f, description="backup of modified trackers")
+    prompt_to_open_reports([output_f, backup_f], description="modified tracker report and its backup")
 # --- END: CORRECTED modify_trackers function ---
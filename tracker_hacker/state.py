@@ -1 +1,3 @@
 main_df = None
+# str-typed 'Tracker' values of main_df; rebuilt lazily, reset whenever main_df changes.
+tracker_str_values = None
@@ -1,9 +1,37 @@
+import json
+import os
 import re
+import sys
 import webbrowser
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
 
 import questionary
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(text):
+    # orjson is optional; anything it rejects (or when it is missing) goes through the stdlib parser,
+    # so accepted input and raised json.JSONDecodeError details match json.loads.
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+@lru_cache(maxsize=16384)
+def load_filters_json(filters_json_str):
+    # Filters parsed once per distinct text and shared by the load-time check, audit, identify and modify.
+    # The result is shared, so callers that edit the parsed filters must parse their own copy with load_json.
+    return load_json(filters_json_str)
+
 
 def handle_cancel(message="Operation cancelled by user.", return_to_menu=False, trigger_exit=False):
     print(f"\n{message}")
@@ -14,26 +42,48 @@ def handle_cancel(message="Operation cancelled by user.", return_to_menu=False,
     return None
 
 
-def prompt_to_open_report(report_path, description=None):
-    report_path_obj = Path(report_path) if report_path else None
-    if not report_path_obj or not report_path_obj.exists():
+NONINTERACTIVE_ENV_VAR = 'TRACKERHACKER_NONINTERACTIVE'
+
+
+def prompts_enabled():
+    if os.environ.get(NONINTERACTIVE_ENV_VAR):
+        return False
+    return sys.stdin is not None and sys.stdin.isatty()
+
+
+def prompt_to_open_report(report_path, description=None, skip_prompt=False):
+    prompt_to_open_reports([report_path], description=description, skip_prompt=skip_prompt)
+
+
+def prompt_to_open_reports(report_paths, description=None, skip_prompt=False):
+    report_path_objs = [Path(report_path) for report_path in report_paths if report_path]
+    report_path_objs = [report_path_obj for report_path_obj in report_path_objs if report_path_obj.exists()]
+    if not report_path_objs or skip_prompt or not prompts_enabled():
         return
 
-    desc = description or report_path_obj.name
+    desc = description or ", ".join(report_path_obj.name for report_path_obj in report_path_objs)
+    locations = ", ".join(str(report_path_obj) for report_path_obj in report_path_objs)
     try:
         wants_open = questionary.confirm(
-            f"Open {desc}? ({report_path_obj})", default=False
+            f"Open {desc}? ({locations})", default=False
         ).ask()
     except KeyboardInterrupt:
         handle_cancel("Report opening prompt interrupted.")
         return
 
     if wants_open:
-        try:
-            webbrowser.open(report_path_obj.resolve().as_uri())
-            print(f"Opening {report_path_obj}...")
-        except Exception as e:
-            print(f"Unable to open {report_path_obj}: {e}")
+        for report_path_obj in report_path_objs:
+            try:
+                webbrowser.open(report_path_obj.resolve().as_uri())
+                print(f"Opening {report_path_obj}...")
+            except Exception as e:
+                print(f"Unable to open {report_path_obj}: {e}")
+
+
+def list_csv_files(dirpath):
+    """Return the sorted CSV files directly inside ``dirpath`` using one directory scan."""
+    with os.scandir(dirpath) as entries:
+        return sorted(Path(e.path) for e in entries if e.name.endswith(".csv") and e.is_file())
 
 
 def remove_field_from_text(text_content, field_api_path_to_remove):
@@ -66,9 +116,11 @@ def swap_field_in_text(text, old_exact_api, new_exact_api):
 
 def add_fields_to_list(text, fields_to_add_list_canonical):
     items = [i.strip() for i in text.split(',') if i.strip()]
+    seen_items = set(items)
     for f_canon in fields_to_add_list_canonical:
-        if f_canon not in items:
+        if f_canon not in seen_items:
             items.append(f_canon)
+            seen_items.add(f_canon)
     return ','.join(items)
 
 
@@ -96,47 +148,72 @@ def get_sitetracker_filter_sobject(full_api_path, base_tracker_sobject_name):
     return object_determining_relationship_name
 
 
+@lru_cache(maxsize=1024)
+def _contextual_field_pattern(canonical_field_name):
+    return re.compile(rf"\b((?:[a-zA-Z0-9_]+__r\.)*{re.escape(canonical_field_name)})\b")
+
+
 def find_contextual_occurrences_of_field(text_to_search, canonical_field_name):
     if not text_to_search or not canonical_field_name:
         return []
-    pattern = rf"\b((?:[a-zA-Z0-9_]+__r\.)*{re.escape(canonical_field_name)})\b"
-    found_paths = set()
-    matches = re.findall(pattern, str(text_to_search))
-    for match in matches:
-        found_paths.add(match)
-    return sorted(list(found_paths))
+    text_to_search = str(text_to_search)
+    # Every match contains the field name verbatim, so most texts are ruled out without the regex.
+    if canonical_field_name not in text_to_search:
+        return []
+    return sorted(set(_contextual_field_pattern(canonical_field_name).findall(text_to_search)))
+
+
+LOGIC_TOKEN_PATTERN = re.compile(r'(\bAND\b|\bOR\b|\(|\)|\b\d+\b)')
 
 
 def update_logic(logic_str, removed_positions):
     if not logic_str:
         return ''
-    tokens = re.split(r'(\bAND\b|\bOR\b|\(|\)|\b\d+\b)', logic_str)
-    new_tokens = []
-    for tok in tokens:
+    # Sorted copy for the renumbering shift (count of removed positions below each kept one, duplicates
+    # included) and a set for the membership test.
+    removed_sorted = sorted(removed_positions)
+    removed_set = set(removed_sorted)
+    # One walk over the split tokens renumbers positions, normalizes operators, drops repeated
+    # operators and collects the distinct positions.
+    collapsed = []
+    kept_positions = set()
+    for tok in LOGIC_TOKEN_PATTERN.split(logic_str):
         t = tok.strip()
         if t.isdigit():
             pos = int(t)
-            if pos not in removed_positions:
-                shift = sum(1 for r_pos in removed_positions if r_pos < pos)
-                new_tokens.append(str(pos - shift))
-        elif t.upper() in ('AND', 'OR') or t in ('(', ')'):
-            new_tokens.append(t.upper())
-    collapsed, prev = [], None
-    for t_col in new_tokens:
-        if t_col == prev and t_col in ('AND', 'OR'):
+            if pos in removed_set:
+                continue
+            t = str(pos - bisect_left(removed_sorted, pos))
+            if t.isdigit():  # duplicate removals can shift a position below zero; those never count
+                kept_positions.add(t)
+        elif t.upper() in ('AND', 'OR'):
+            t = t.upper()
+            if collapsed and collapsed[-1] == t:
+                continue
+        elif t not in ('(', ')'):
             continue
-        collapsed.append(t_col)
-        prev = t_col
-    digits = [tok_d for tok_d in collapsed if tok_d.isdigit()]
-    unique_digits = sorted(set(digits), key=int)
-    if len(unique_digits) == 1:
-        return unique_digits[0]
-    s_logic = ' '.join(collapsed)
-    s_logic = re.sub(r'\(\s*', '(', s_logic)
-    s_logic = re.sub(r'\s*\)', ')', s_logic)
-    s_logic = re.sub(r'\b(AND|OR)\s*$', '', s_logic, flags=re.IGNORECASE)
-    s_logic = re.sub(r'^\s*(AND|OR)\s+', '', s_logic, flags=re.IGNORECASE)
-    return s_logic.strip()
+        collapsed.append(t)
+    if len(kept_positions) == 1:
+        return kept_positions.pop()
+    # Drop one trailing operator, then a leading one when whitespace follows it in the joined string
+    # (always, unless it is directly followed by ')').
+    trailing_op_removed = bool(collapsed) and collapsed[-1] in ('AND', 'OR')
+    if trailing_op_removed:
+        collapsed.pop()
+    if collapsed and collapsed[0] in ('AND', 'OR'):
+        if (len(collapsed) > 1 and collapsed[1] != ')') or (len(collapsed) == 1 and trailing_op_removed):
+            collapsed.pop(0)
+    # Space-separated, except directly inside parentheses.
+    parts = []
+    for t in collapsed:
+        if parts and parts[-1] != '(' and t != ')':
+            parts.append(' ')
+        parts.append(t)
+    return ''.join(parts)
+
+
+# A leading or trailing AND/OR in an already whitespace-collapsed WHERE condition.
+EDGE_OPERATOR_PATTERN = re.compile(r'^(AND|OR)\s+|\s+(AND|OR)$', flags=re.IGNORECASE)
 
 
 def update_query(query_str, contextual_paths_to_remove):
@@ -180,10 +257,7 @@ def update_query(query_str, contextual_paths_to_remove):
     if not new_cond_parts:
         prefix_no_w = query_str[:m.start(1)] + prefix_w.strip()[:-5].rstrip()
         return (prefix_no_w + suffix_o).strip()
-    s_cond = ' '.join(new_cond_parts)
-    s_cond = re.sub(r'\s+', ' ', s_cond).strip()
-    s_cond = re.sub(r'^\s*(AND|OR)\s+', '', s_cond, flags=re.IGNORECASE)
-    s_cond = re.sub(r'\s+(AND|OR)\s*$', '', s_cond, flags=re.IGNORECASE)
+    s_cond = EDGE_OPERATOR_PATTERN.sub('', ' '.join(' '.join(new_cond_parts).split()))
     if not s_cond:
         prefix_no_w = query_str[:m.start(1)] + prefix_w.strip()[:-5].rstrip()
         return (prefix_no_w + suffix_o).strip()